@@ -0,0 +1,32 @@
+"""Add partial index on users(team_id) for active members.
+
+Supports the per-team active member count in list_teams. The existing
+uq_subscription_page_user constraint already leads with tracked_page_id,
+so tracked_page_subscriptions needs no extra index.
+
+Revision ID: 008_users_team_active_index
+Revises: 007_engagement_retry_fields
+Create Date: 2026-03-02
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "008_users_team_active_index"
+down_revision = "007_engagement_retry_fields"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_team_id_active",
+        "users",
+        ["team_id"],
+        unique=False,
+        postgresql_where=sa.text("is_active = true"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_team_id_active", table_name="users")
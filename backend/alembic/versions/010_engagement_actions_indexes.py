@@ -0,0 +1,38 @@
+"""Add composite indexes on engagement_actions for the scheduling queries.
+
+schedule_staggered_engagements checks, per subscriber, whether an action
+already exists for (post_id, user_id), then counts the user's likes and
+comments created today by (user_id, action_type, created_at). Neither
+query could use an index before, so both scanned every action row.
+
+Revision ID: 010_engagement_actions_indexes
+Revises: 008_users_team_active_index
+Create Date: 2026-03-03
+"""
+
+from alembic import op
+
+revision = "010_engagement_actions_indexes"
+down_revision = "008_users_team_active_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_engagement_actions_post_user",
+        "engagement_actions",
+        ["post_id", "user_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_engagement_actions_user_type_created",
+        "engagement_actions",
+        ["user_id", "action_type", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_engagement_actions_user_type_created", table_name="engagement_actions")
+    op.drop_index("ix_engagement_actions_post_user", table_name="engagement_actions")
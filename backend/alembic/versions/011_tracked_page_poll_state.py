@@ -0,0 +1,57 @@
+"""Move last_polled_at and last_poll_status into tracked_page_poll_state.
+
+Every poll rewrote the tracked_pages row, URL and all, just to record when it
+ran. The poll result now lives in a narrow table keyed by the page id, so the
+per-poll update writes a small row version instead.
+
+Revision ID: 011_tracked_page_poll_state
+Revises: 010_engagement_actions_indexes
+Create Date: 2026-03-04
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "011_tracked_page_poll_state"
+down_revision = "010_engagement_actions_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tracked_page_poll_state",
+        sa.Column(
+            "tracked_page_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tracked_pages.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("last_polled_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_poll_status", sa.String(50), nullable=True),
+    )
+    op.execute(
+        "INSERT INTO tracked_page_poll_state (tracked_page_id, last_polled_at, last_poll_status) "
+        "SELECT id, last_polled_at, last_poll_status FROM tracked_pages "
+        "WHERE last_polled_at IS NOT NULL"
+    )
+    op.drop_column("tracked_pages", "last_poll_status")
+    op.drop_column("tracked_pages", "last_polled_at")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "tracked_pages",
+        sa.Column("last_polled_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "tracked_pages",
+        sa.Column("last_poll_status", sa.String(50), nullable=True),
+    )
+    op.execute(
+        "UPDATE tracked_pages SET last_polled_at = s.last_polled_at, "
+        "last_poll_status = s.last_poll_status "
+        "FROM tracked_page_poll_state s WHERE s.tracked_page_id = tracked_pages.id"
+    )
+    op.drop_table("tracked_page_poll_state")
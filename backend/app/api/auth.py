@@ -7,6 +7,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import RedirectResponse
 
+from app.automation.cookie_cache import invalidate_session_cookies
 from app.config import settings
 from app.core.dependencies import get_current_user
 from app.core.linkedin_oauth import (
@@ -230,6 +231,7 @@ async def auth_linkedin_callback(
             integration.settings = person_settings
         if session_cookies:
             integration.session_cookies = session_cookies
+            invalidate_session_cookies(user.id, Platform.LINKEDIN)
     else:
         integration = IntegrationAccount(
             user_id=user.id,
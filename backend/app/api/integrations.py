@@ -1,5 +1,5 @@
 import asyncio
-import json
+import contextlib
 import logging
 import urllib.parse
 import uuid as uuid_mod
@@ -12,6 +12,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.responses import RedirectResponse
 
+from app.automation.cookie_cache import invalidate_session_cookies
 from app.config import settings
 from app.core.dependencies import get_current_user
 from app.core.linkedin_oauth import (
@@ -22,7 +23,7 @@ from app.core.linkedin_oauth import (
     fetch_linkedin_profile,
 )
 from app.core.oauth_state import create_oauth_state, validate_oauth_state
-from app.core.security import encrypt_value
+from app.core.security import encrypt_json, encrypt_value
 from app.database import get_db
 from app.models.integration import IntegrationAccount, Platform
 from app.models.user import User
@@ -142,15 +143,13 @@ async def save_linkedin_session_cookies(
         )
 
     # Encrypt cookies before storing
-    encrypted_cookies = encrypt_value(json.dumps(cookies))
+    encrypted_cookies = encrypt_json(cookies)
 
     # Get user info from validation
     user_name = validation_result.get("user_name")
     user_id = validation_result.get("user_id")
 
     # Set session expiry (li_at typically lasts ~1 year from last login)
-    from datetime import UTC, timedelta
-
     session_expires = datetime.now(UTC) + timedelta(days=365)
 
     # Upsert session cookies on the user's LinkedIn integration
@@ -184,6 +183,7 @@ async def save_linkedin_session_cookies(
         db.add(integration)
 
     await db.commit()
+    invalidate_session_cookies(current_user.id, Platform.LINKEDIN)
     logger.info(f"Saved LinkedIn session cookies for user {current_user.id}")
 
     return {
@@ -374,7 +374,6 @@ async def _cleanup_login_session(session_id: str):
     session = _login_sessions.pop(session_id, None)
     if not session:
         return
-    import contextlib
 
     with contextlib.suppress(Exception):
         await session["browser"].close()
@@ -606,7 +605,7 @@ async def linkedin_login_verify(
 async def _save_login_cookies(db: AsyncSession, user_id, session_cookies: list[dict]):
     """Save extracted LinkedIn session cookies to the user's integration."""
     # Encrypt cookies before storing
-    encrypted_cookies = encrypt_value(json.dumps(session_cookies))
+    encrypted_cookies = encrypt_json(session_cookies)
 
     result = await db.execute(
         select(IntegrationAccount).where(
@@ -627,4 +626,5 @@ async def _save_login_cookies(db: AsyncSession, user_id, session_cookies: list[d
         db.add(integration)
 
     await db.commit()
+    invalidate_session_cookies(user_id, Platform.LINKEDIN)
     logger.info(f"Saved LinkedIn session cookies via login flow for user {user_id}")
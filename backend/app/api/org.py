@@ -182,16 +182,20 @@ async def list_members(
         teams_result = await db.execute(select(Team).where(Team.id.in_(team_ids)))
         team_names = {t.id: t.name for t in teams_result.scalars().all()}
 
-    response = []
-    for member in members:
+    # Resolve active integrations for all members in one query
+    platforms: dict = {m.id: [] for m in members}
+    if members:
         int_result = await db.execute(
-            select(IntegrationAccount.platform).where(
-                IntegrationAccount.user_id == member.id,
+            select(IntegrationAccount.user_id, IntegrationAccount.platform).where(
+                IntegrationAccount.user_id.in_(list(platforms)),
                 IntegrationAccount.is_active.is_(True),
             )
         )
-        platforms = [row[0].value for row in int_result.all()]
+        for user_id, platform in int_result.all():
+            platforms[user_id].append(platform.value)
 
+    response = []
+    for member in members:
         response.append(
             OrgMemberResponse(
                 id=member.id,
@@ -200,7 +204,7 @@ async def list_members(
                 role=member.role.value,
                 is_active=member.is_active,
                 created_at=member.created_at,
-                integrations=platforms,
+                integrations=platforms[member.id],
                 team_id=member.team_id,
                 team_name=team_names.get(member.team_id),
             )
@@ -70,32 +70,33 @@ async def list_teams(
     db: AsyncSession = Depends(get_db),
 ):
     """List all teams in the current user's organization with member counts."""
-    teams_result = await db.execute(
-        select(Team).where(Team.org_id == current_user.org_id).order_by(Team.name)
-    )
-    teams = teams_result.scalars().all()
-
-    response = []
-    for team in teams:
-        count_result = await db.execute(
-            select(func.count()).select_from(User).where(
-                User.team_id == team.id,
-                User.is_active.is_(True),
-            )
-        )
-        member_count = count_result.scalar() or 0
-
-        response.append(
-            TeamResponse(
-                id=team.id,
-                org_id=team.org_id,
-                name=team.name,
-                member_count=member_count,
-                created_at=team.created_at,
-            )
+    member_counts = (
+        select(User.team_id, func.count().label("member_count"))
+        .where(
+            User.org_id == current_user.org_id,
+            User.team_id.is_not(None),
+            User.is_active.is_(True),
         )
+        .group_by(User.team_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(Team, func.coalesce(member_counts.c.member_count, 0))
+        .outerjoin(member_counts, member_counts.c.team_id == Team.id)
+        .where(Team.org_id == current_user.org_id)
+        .order_by(Team.name)
+    )
 
-    return response
+    return [
+        TeamResponse(
+            id=team.id,
+            org_id=team.org_id,
+            name=team.name,
+            member_count=member_count,
+            created_at=team.created_at,
+        )
+        for team, member_count in result.all()
+    ]
 
 
 @router.put("/{team_id}", response_model=TeamResponse, summary="Update team")
@@ -176,9 +177,9 @@ async def create_team_invite(
 
     # Verify team exists in this org
     team_result = await db.execute(
-        select(Team).where(Team.id == team_id, Team.org_id == current_user.org_id)
+        select(Team.id).where(Team.id == team_id, Team.org_id == current_user.org_id)
     )
-    if not team_result.scalar_one_or_none():
+    if team_result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Team not found")
 
     invite = OrgInvite(
@@ -231,9 +232,9 @@ async def assign_member_to_team(
 
     if request.team_id:
         team_result = await db.execute(
-            select(Team).where(Team.id == request.team_id, Team.org_id == current_user.org_id)
+            select(Team.id).where(Team.id == request.team_id, Team.org_id == current_user.org_id)
         )
-        if not team_result.scalar_one_or_none():
+        if team_result.scalar_one_or_none() is None:
             raise HTTPException(status_code=404, detail="Team not found")
 
     member.team_id = request.team_id
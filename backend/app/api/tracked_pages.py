@@ -2,15 +2,26 @@ import csv
 import io
 import logging
 import uuid
+from collections.abc import Iterator
+from functools import partial
 
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-from sqlalchemy import select
+import redis as sync_redis
+from fastapi import APIRouter, Depends, File, HTTPException, Response, UploadFile, status
+from sqlalchemy import exists, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
 
+from app.config import settings
 from app.core.dependencies import get_current_user
-from app.database import get_db
+from app.database import dialect_insert, get_db
+from app.models.engagement import EngagementAction
 from app.models.post import Post
-from app.models.tracked_page import PollingMode, TrackedPage, TrackedPageSubscription
+from app.models.tracked_page import (
+    PollingMode,
+    TrackedPage,
+    TrackedPagePollState,
+    TrackedPageSubscription,
+)
 from app.models.user import User
 from app.schemas.tracked_page import (
     EngagementBrief,
@@ -30,11 +41,28 @@ from app.services.url_utils import (
     extract_post_id,
     normalize_url,
 )
+from app.workers.engagement_tasks import schedule_staggered_engagements
+from app.workers.polling_tasks import poll_single_page_task
+
+try:
+    import openpyxl
+except ImportError:  # Excel import is optional; CSV always works
+    openpyxl = None
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/tracked-pages", tags=["tracked-pages"])
 
+_redis_client: sync_redis.Redis | None = None
+
+
+def _get_redis() -> sync_redis.Redis:
+    """Return a process-wide Redis client, created on first use."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = sync_redis.from_url(settings.redis_url)
+    return _redis_client
+
 
 @router.post("", response_model=TrackedPageResponse, status_code=status.HTTP_201_CREATED, summary="Create Tracked Page")
 async def create_tracked_page(
@@ -54,40 +82,48 @@ async def create_tracked_page(
 
     # Check for duplicate URL in org
     existing = await db.execute(
-        select(TrackedPage).where(
+        select(TrackedPage.id)
+        .where(
             TrackedPage.org_id == current_user.org_id,
             TrackedPage.url == normalized,
         )
+        .limit(1)
     )
-    if existing.scalar_one_or_none():
+    if existing.scalar_one_or_none() is not None:
         raise HTTPException(status_code=409, detail="This page is already being tracked")
 
     external_id = extract_external_id(request.url, platform)
     page_type = detect_page_type(request.url, platform)
 
+    # Load member ids before adding the page so autoflush doesn't issue its INSERT early
+    member_ids = (
+        await db.execute(
+            select(User.id).where(
+                User.org_id == current_user.org_id,
+                User.is_active.is_(True),
+            )
+        )
+    ).scalars().all()
+
+    # Pre-assign the id so subscriptions can reference it and everything goes in one flush
     page = TrackedPage(
+        id=uuid.uuid4(),
         org_id=current_user.org_id,
         platform=platform,
         external_id=external_id,
         url=normalized,
         name=request.name or external_id or request.url,
         page_type=page_type,
+        poll_state=None,
     )
     db.add(page)
-    await db.flush()
 
     # Auto-subscribe ALL active org members
-    all_users_result = await db.execute(
-        select(User).where(
-            User.org_id == current_user.org_id,
-            User.is_active.is_(True),
-        )
-    )
-    for member in all_users_result.scalars().all():
+    for member_id in member_ids:
         db.add(
             TrackedPageSubscription(
                 tracked_page_id=page.id,
-                user_id=member.id,
+                user_id=member_id,
                 auto_like=True,
                 auto_comment=True,
                 polling_mode=PollingMode.NORMAL,
@@ -106,6 +142,7 @@ async def list_tracked_pages(
     """List all tracked pages for the current user's organization."""
     result = await db.execute(
         select(TrackedPage)
+        .options(joinedload(TrackedPage.poll_state))
         .where(TrackedPage.org_id == current_user.org_id)
         .order_by(TrackedPage.created_at.desc())
     )
@@ -121,9 +158,9 @@ async def update_tracked_page(
 ):
     """Update a tracked page's name or active status."""
     result = await db.execute(
-        select(TrackedPage).where(
-            TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id
-        )
+        select(TrackedPage)
+        .options(joinedload(TrackedPage.poll_state))
+        .where(TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id)
     )
     page = result.scalar_one_or_none()
     if not page:
@@ -162,34 +199,39 @@ async def subscribe_to_page(
     db: AsyncSession = Depends(get_db),
 ):
     """Subscribe the current user to a tracked page for auto-engagement."""
+    sub_table = TrackedPageSubscription.__table__
+    # INSERT ... SELECT from the org-scoped page so ownership check, duplicate
+    # check and insert happen in one statement on the happy path.
+    page_row = select(
+        literal(uuid.uuid4(), sub_table.c.id.type),
+        TrackedPage.id,
+        literal(current_user.id, sub_table.c.user_id.type),
+        literal(request.auto_like),
+        literal(request.auto_comment),
+        literal(PollingMode(request.polling_mode), sub_table.c.polling_mode.type),
+        literal(request.tags, sub_table.c.tags.type),
+    ).where(TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id)
     result = await db.execute(
-        select(TrackedPage).where(
-            TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id
+        dialect_insert(db, TrackedPageSubscription)
+        .from_select(
+            ["id", "tracked_page_id", "user_id", "auto_like", "auto_comment", "polling_mode", "tags"],
+            page_row,
         )
+        .on_conflict_do_nothing(index_elements=["tracked_page_id", "user_id"])
+        .returning(*sub_table.c)
     )
-    if not result.scalar_one_or_none():
-        raise HTTPException(status_code=404, detail="Tracked page not found")
+    sub = result.mappings().one_or_none()
+    if sub is not None:
+        return sub
 
-    result = await db.execute(
-        select(TrackedPageSubscription).where(
-            TrackedPageSubscription.tracked_page_id == page_id,
-            TrackedPageSubscription.user_id == current_user.id,
+    page_exists = await db.execute(
+        select(
+            exists().where(TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id)
         )
     )
-    if result.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Already subscribed")
-
-    sub = TrackedPageSubscription(
-        tracked_page_id=page_id,
-        user_id=current_user.id,
-        auto_like=request.auto_like,
-        auto_comment=request.auto_comment,
-        polling_mode=PollingMode(request.polling_mode),
-        tags=request.tags,
-    )
-    db.add(sub)
-    await db.flush()
-    return sub
+    if not page_exists.scalar():
+        raise HTTPException(status_code=404, detail="Tracked page not found")
+    raise HTTPException(status_code=409, detail="Already subscribed")
 
 
 @router.put("/{page_id}/subscribe", response_model=SubscriptionResponse, summary="Update Page Subscription")
@@ -220,6 +262,56 @@ async def update_subscription(
 # --- CSV/Excel Bulk Import ---
 
 
+# Keep IN (...) lists well under the driver's bind parameter limit
+_IMPORT_LOOKUP_BATCH = 1000
+
+
+def _iter_csv_rows(text: str) -> Iterator[dict[str, str]]:
+    """Yield ``{"url", "name"}`` records from CSV text, skipping rows without a URL."""
+    reader = csv.DictReader(io.StringIO(text))
+    # Resolve case-insensitive column names once instead of probing variants per row
+    fieldnames_lower = {f.lower().strip(): f for f in reader.fieldnames or []}
+    url_key = fieldnames_lower.get("url")
+    if url_key is None:
+        raise HTTPException(status_code=400, detail="CSV must have a 'url' column header")
+    name_key = fieldnames_lower.get("name")
+    for row in reader:
+        url_val = (row[url_key] or "").strip()
+        name_val = (row[name_key] or "").strip() if name_key else ""
+        if url_val:
+            yield {"url": url_val, "name": name_val}
+
+
+def _iter_xlsx_rows(content: bytes) -> Iterator[dict[str, str]]:
+    """Yield ``{"url", "name"}`` records from an .xlsx workbook, skipping rows without a URL."""
+    if openpyxl is None:
+        raise HTTPException(
+            status_code=400, detail="Excel support requires openpyxl. Please use CSV format."
+        )
+
+    wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True)
+    ws = wb.active
+    if not ws:
+        raise HTTPException(status_code=400, detail="Empty workbook")
+    headers = [
+        str(cell.value or "").strip().lower()
+        for cell in next(ws.iter_rows(min_row=1, max_row=1))
+    ]
+    if "url" not in headers:
+        raise HTTPException(status_code=400, detail="Missing 'url' column in Excel file")
+    url_idx = headers.index("url")
+    name_idx = headers.index("name") if "name" in headers else None
+    for row in ws.iter_rows(min_row=2, values_only=True):
+        url_val = str(row[url_idx] or "").strip()
+        name_val = (
+            str(row[name_idx] or "").strip()
+            if name_idx is not None and row[name_idx]
+            else ""
+        )
+        if url_val:
+            yield {"url": url_val, "name": name_val}
+
+
 @router.post("/import", response_model=ImportResult, summary="Bulk Import Tracked Pages")
 async def import_tracked_pages(
     file: UploadFile = File(...),
@@ -230,58 +322,49 @@ async def import_tracked_pages(
 
     CSV format: url,name (header row required)
     Excel format: .xlsx with 'url' and optional 'name' columns
+
+    Rows are streamed twice: once to collect URLs for a batched duplicate
+    lookup, then again to create the pages.
     """
     content = await file.read()
-    rows: list[dict[str, str]] = []
 
     filename = (file.filename or "").lower()
     if filename.endswith(".xlsx"):
-        try:
-            import openpyxl
-
-            wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True)
-            ws = wb.active
-            if not ws:
-                raise HTTPException(status_code=400, detail="Empty workbook")
-            headers = [
-                str(cell.value or "").strip().lower()
-                for cell in next(ws.iter_rows(min_row=1, max_row=1))
-            ]
-            if "url" not in headers:
-                raise HTTPException(status_code=400, detail="Missing 'url' column in Excel file")
-            url_idx = headers.index("url")
-            name_idx = headers.index("name") if "name" in headers else None
-            for row in ws.iter_rows(min_row=2, values_only=True):
-                url_val = str(row[url_idx] or "").strip()
-                name_val = (
-                    str(row[name_idx] or "").strip()
-                    if name_idx is not None and row[name_idx]
-                    else ""
-                )
-                if url_val:
-                    rows.append({"url": url_val, "name": name_val})
-        except ImportError as exc:
-            raise HTTPException(
-                status_code=400, detail="Excel support requires openpyxl. Please use CSV format."
-            ) from exc
+        iter_rows = partial(_iter_xlsx_rows, content)
     else:
         # Assume CSV
-        text = content.decode("utf-8-sig")
-        reader = csv.DictReader(io.StringIO(text))
-        if not reader.fieldnames or "url" not in [f.lower().strip() for f in reader.fieldnames]:
-            raise HTTPException(status_code=400, detail="CSV must have a 'url' column header")
-        for row in reader:
-            # Handle case-insensitive column names
-            url_val = (row.get("url") or row.get("URL") or row.get("Url") or "").strip()
-            name_val = (row.get("name") or row.get("Name") or row.get("NAME") or "").strip()
-            if url_val:
-                rows.append({"url": url_val, "name": name_val})
+        iter_rows = partial(_iter_csv_rows, content.decode("utf-8-sig"))
+
+    # Pass 1: only URL strings are held in memory for the duplicate lookup
+    candidate_urls = list({normalize_url(row["url"]) for row in iter_rows()})
+    existing_urls: set[str] = set()
+    for offset in range(0, len(candidate_urls), _IMPORT_LOOKUP_BATCH):
+        batch = candidate_urls[offset : offset + _IMPORT_LOOKUP_BATCH]
+        existing_result = await db.execute(
+            select(TrackedPage.url).where(
+                TrackedPage.org_id == current_user.org_id,
+                TrackedPage.url.in_(batch),
+            )
+        )
+        existing_urls.update(existing_result.scalars().all())
+
+    # Auto-subscribe ALL active org members to every imported page
+    member_ids = (
+        await db.execute(
+            select(User.id).where(
+                User.org_id == current_user.org_id,
+                User.is_active.is_(True),
+            )
+        )
+    ).scalars().all()
 
     imported = 0
     skipped = 0
     errors = []
+    new_objects: list[TrackedPage | TrackedPageSubscription] = []
 
-    for i, row in enumerate(rows):
+    # Pass 2: build pages and subscriptions, then write them in a single flush
+    for i, row in enumerate(iter_rows()):
         url = normalize_url(row["url"])
         name = row.get("name", "")
 
@@ -293,50 +376,40 @@ async def import_tracked_pages(
             errors.append(f"Row {i + 2}: Unsupported platform for URL: {url}")
             continue
 
-        # Check for duplicate URL in org
-        existing = await db.execute(
-            select(TrackedPage).where(
-                TrackedPage.org_id == current_user.org_id,
-                TrackedPage.url == url,
-            )
-        )
-        if existing.scalar_one_or_none():
+        # Skip URLs already tracked in the org (or repeated earlier in this file)
+        if url in existing_urls:
             skipped += 1
             continue
+        existing_urls.add(url)
 
         external_id = extract_external_id(url, platform)
         page_type = detect_page_type(url, platform)
 
-        page = TrackedPage(
-            org_id=current_user.org_id,
-            platform=platform,
-            external_id=external_id,
-            url=url,
-            name=name or external_id or url,
-            page_type=page_type,
-        )
-        db.add(page)
-        await db.flush()
-
-        # Auto-subscribe ALL active org members
-        members_result = await db.execute(
-            select(User).where(
-                User.org_id == current_user.org_id,
-                User.is_active.is_(True),
+        page_id = uuid.uuid4()
+        new_objects.append(
+            TrackedPage(
+                id=page_id,
+                org_id=current_user.org_id,
+                platform=platform,
+                external_id=external_id,
+                url=url,
+                name=name or external_id or url,
+                page_type=page_type,
             )
         )
-        for member in members_result.scalars().all():
-            db.add(
-                TrackedPageSubscription(
-                    tracked_page_id=page.id,
-                    user_id=member.id,
-                    auto_like=True,
-                    auto_comment=True,
-                    polling_mode=PollingMode.NORMAL,
-                )
+        new_objects.extend(
+            TrackedPageSubscription(
+                tracked_page_id=page_id,
+                user_id=member_id,
+                auto_like=True,
+                auto_comment=True,
+                polling_mode=PollingMode.NORMAL,
             )
+            for member_id in member_ids
+        )
         imported += 1
 
+    db.add_all(new_objects)
     await db.flush()
     return ImportResult(imported=imported, skipped=skipped, errors=errors)
 
@@ -354,44 +427,43 @@ async def submit_post_url(
     """Manually submit a post URL to trigger auto-engagement."""
     # Verify page belongs to user's org
     result = await db.execute(
-        select(TrackedPage).where(
+        select(TrackedPage.platform).where(
             TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id
         )
     )
-    page = result.scalar_one_or_none()
-    if not page:
+    platform = result.scalar_one_or_none()
+    if platform is None:
         raise HTTPException(status_code=404, detail="Tracked page not found")
 
     # Extract external post ID based on platform
-    external_post_id = extract_post_id(request.url, page.platform)
+    external_post_id = extract_post_id(request.url, platform)
     if not external_post_id:
         raise HTTPException(
             status_code=400,
             detail="Could not extract post ID from URL. Please check the URL format.",
         )
 
-    # Deduplicate
-    existing = await db.execute(select(Post).where(Post.external_post_id == external_post_id))
-    if existing.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Post already submitted")
-
-    # Create post
-    post = Post(
-        tracked_page_id=page.id,
-        platform=page.platform,
-        external_post_id=external_post_id,
-        url=request.url,
+    # Create post; the unique external_post_id makes concurrent duplicates a no-op
+    result = await db.execute(
+        dialect_insert(db, Post)
+        .values(
+            tracked_page_id=page_id,
+            platform=platform,
+            external_post_id=external_post_id,
+            url=request.url,
+        )
+        .on_conflict_do_nothing(index_elements=[Post.external_post_id])
+        .returning(Post.id)
     )
-    db.add(post)
-    await db.flush()
+    post_id = result.scalar_one_or_none()
+    if post_id is None:
+        raise HTTPException(status_code=409, detail="Post already submitted")
 
     # Enqueue engagement
-    from app.workers.engagement_tasks import schedule_staggered_engagements
+    schedule_staggered_engagements.delay(str(post_id), str(page_id))
 
-    schedule_staggered_engagements.delay(str(post.id), str(page.id))
-
-    logger.info(f"Manual post submitted: {request.url} for page {page.name}")
-    return {"message": "Post submitted for engagement", "post_id": str(post.id)}
+    logger.info(f"Manual post submitted: {request.url} for page {page_id}")
+    return {"message": "Post submitted for engagement", "post_id": str(post_id)}
 
 
 # --- Poll Now ---
@@ -405,20 +477,18 @@ async def poll_page_now(
 ):
     """Trigger an immediate poll for a tracked page."""
     result = await db.execute(
-        select(TrackedPage).where(
+        select(TrackedPage.active).where(
             TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id
         )
     )
-    page = result.scalar_one_or_none()
-    if not page:
+    active = result.scalar_one_or_none()
+    if active is None:
         raise HTTPException(status_code=404, detail="Tracked page not found")
-    if not page.active:
+    if not active:
         raise HTTPException(status_code=400, detail="Page is inactive — activate it first")
 
-    from app.workers.polling_tasks import poll_single_page_task
-
-    poll_single_page_task.delay(str(page.id))
-    return {"message": "Poll triggered", "page_id": str(page.id)}
+    poll_single_page_task.delay(str(page_id))
+    return {"message": "Poll triggered", "page_id": str(page_id)}
 
 
 # --- Page Posts with Engagement Status ---
@@ -432,14 +502,12 @@ async def get_page_posts(
     limit: int = 20,
 ):
     """Get recent posts for a tracked page with their engagement status."""
-    from app.models.engagement import EngagementAction
-
     result = await db.execute(
-        select(TrackedPage).where(
+        select(TrackedPage.id).where(
             TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id
         )
     )
-    if not result.scalar_one_or_none():
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Tracked page not found")
 
     posts_result = await db.execute(
@@ -491,35 +559,30 @@ async def get_poll_status(
 ):
     """Get the last poll status for a tracked page.
 
-    Reads from Redis first (fast path). Falls back to the DB columns
-    `last_polled_at` / `last_poll_status` when the Redis key has expired.
+    Reads from Redis first (fast path). Falls back to the page's
+    `tracked_page_poll_state` row when the Redis key has expired.
     """
-    import json
-
-    import redis as sync_redis
-
-    from app.config import settings
-
     result = await db.execute(
-        select(TrackedPage).where(
-            TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id
-        )
+        select(TrackedPage.id, TrackedPagePollState)
+        .outerjoin(TrackedPagePollState, TrackedPagePollState.tracked_page_id == TrackedPage.id)
+        .where(TrackedPage.id == page_id, TrackedPage.org_id == current_user.org_id)
     )
-    page = result.scalar_one_or_none()
-    if not page:
+    row = result.one_or_none()
+    if row is None:
         raise HTTPException(status_code=404, detail="Tracked page not found")
+    poll_state = row[1]
 
     # Fast path: Redis
-    r = sync_redis.from_url(settings.redis_url)
-    raw = r.get(f"autoengage:poll_status:{page_id}")
+    raw = _get_redis().get(f"autoengage:poll_status:{page_id}")
     if raw:
-        return json.loads(raw)
+        # The worker stores the status as JSON already; pass the bytes through untouched
+        return Response(content=raw, media_type="application/json")
 
-    # Fallback: DB persistent columns
-    if page.last_polled_at:
+    # Fallback: DB persistent poll state
+    if poll_state is not None:
         return {
-            "status": page.last_poll_status or "ok",
-            "last_polled_at": page.last_polled_at.isoformat(),
+            "status": poll_state.last_poll_status or "ok",
+            "last_polled_at": poll_state.last_polled_at.isoformat(),
             "posts_found": None,
             "new_posts": None,
             "error": None,
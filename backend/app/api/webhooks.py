@@ -1,28 +1,44 @@
 import logging
-from urllib.parse import urlparse
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, BackgroundTasks, Depends
 from pydantic import BaseModel
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import func, literal, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import dialect_insert, get_db
+from app.models.integration import Platform
 from app.models.post import Post
 from app.models.tracked_page import TrackedPage
+from app.services.post_batcher import insert_post
 from app.services.url_utils import (
+    FACEBOOK_DOMAINS,
+    INSTAGRAM_DOMAINS,
+    LINKEDIN_DOMAINS,
     extract_facebook_post_id,
     extract_instagram_post_id,
     extract_linkedin_post_id,
-    is_facebook_url,
-    is_instagram_url,
-    is_linkedin_url,
+    split_url,
 )
+from app.workers.engagement_tasks import schedule_staggered_engagements
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
+# Registered domains we accept links from, by site; subdomains (www., m., web.) also match
+_SITE_BY_DOMAIN = {
+    **dict.fromkeys(LINKEDIN_DOMAINS, "linkedin"),
+    **dict.fromkeys(INSTAGRAM_DOMAINS, "instagram"),
+    **dict.fromkeys(FACEBOOK_DOMAINS, "facebook"),
+}
+
+
+def _site_for_host(host: str) -> str | None:
+    """Return the site ``host`` belongs to, or None if it is not a supported domain."""
+    # Every supported domain has two labels, so compare the host's last two
+    return _SITE_BY_DOMAIN.get(".".join(host.rstrip(".").rsplit(".", 2)[-2:]))
+
 
 class WhatsAppLinkEvent(BaseModel):
     url: str
@@ -31,106 +47,115 @@ class WhatsAppLinkEvent(BaseModel):
     timestamp: str
 
 
+async def _find_tracked_page(
+    db: AsyncSession, host: str, path: str, is_meta_url: bool
+) -> TrackedPage | None:
+    """Find the active tracked page whose external_id appears in the link path.
+
+    The page must live on the same host as the link, or, for Meta links, be
+    any Meta page (IG/FB pages may use different domains).
+    """
+    # external_id is matched as a plain substring of the path, so escape LIKE wildcards
+    escaped_external_id = func.replace(
+        func.replace(func.replace(TrackedPage.external_id, "\\", "\\\\"), "%", "\\%"),
+        "_",
+        "\\_",
+    )
+    host_match = [
+        TrackedPage.url.startswith(f"https://{host}/", autoescape=True),
+        TrackedPage.url.startswith(f"http://{host}/", autoescape=True),
+    ]
+    if is_meta_url:
+        host_match.append(TrackedPage.platform == Platform.META)
+
+    result = await db.execute(
+        select(TrackedPage)
+        .where(
+            TrackedPage.active.is_(True),
+            TrackedPage.external_id.is_not(None),
+            TrackedPage.external_id != "",
+            literal(path).contains(escaped_external_id, escape="\\"),
+            or_(*host_match),
+        )
+        .limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
 @router.post("/whatsapp-link", summary="Handle WhatsApp Link Event")
 async def handle_whatsapp_link(
     event: WhatsAppLinkEvent,
+    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """Process a social media link shared in a WhatsApp group."""
-    parsed = urlparse(event.url)
-    domain = parsed.netloc.lower()
-
-    # Only process social media links
-    supported_domains = [
-        "linkedin.com",
-        "www.linkedin.com",
-        "instagram.com",
-        "www.instagram.com",
-        "instagr.am",
-        "facebook.com",
-        "www.facebook.com",
-        "fb.com",
-        "m.facebook.com",
-        "web.facebook.com",
-    ]
-    if not any(d in domain for d in supported_domains):
+    host, path = split_url(event.url)
+
+    # Only process social media links; the site also picks the post ID extractor below
+    site = _site_for_host(host)
+    if site is None:
         return {"status": "ignored", "reason": "Not a supported social media URL"}
 
+    is_meta_url = site != "linkedin"
+
     # Check if this matches a tracked page
-    result = await db.execute(select(TrackedPage).where(TrackedPage.active.is_(True)))
-    tracked_pages = result.scalars().all()
-
-    # Determine platform from URL for matching
-    is_meta_url = is_instagram_url(event.url) or is_facebook_url(event.url)
-
-    matched_page = None
-    for page in tracked_pages:
-        if (
-            page.url
-            and urlparse(page.url).netloc == parsed.netloc
-            and page.external_id
-            and page.external_id in parsed.path
-        ):
-            matched_page = page
-            break
-        # For Meta URLs, also match by platform (IG/FB pages may have different domains)
-        if (
-            is_meta_url
-            and page.platform.value == "meta"
-            and page.external_id
-            and page.external_id in parsed.path
-        ):
-            matched_page = page
-            break
+    matched_page = await _find_tracked_page(db, host, path, is_meta_url)
 
     if matched_page:
         # Extract post ID from URL based on platform
-        external_post_id = None
-        if is_linkedin_url(event.url):
+        if site == "linkedin":
             external_post_id = extract_linkedin_post_id(event.url)
-        elif is_instagram_url(event.url):
+        elif site == "instagram":
             external_post_id = extract_instagram_post_id(event.url)
             if external_post_id:
                 external_post_id = f"ig_{external_post_id}"
-        elif is_facebook_url(event.url):
+        else:
             external_post_id = extract_facebook_post_id(event.url)
 
         if not external_post_id:
             # Use full path as fallback identifier
-            external_post_id = parsed.path.strip("/")
+            external_post_id = path.strip("/")
 
         if not external_post_id:
             return {"status": "error", "message": "Could not extract post identifier from URL"}
 
-        # Deduplicate: check if we already processed this post
-        existing = await db.execute(select(Post).where(Post.external_post_id == external_post_id))
-        if existing.scalar_one_or_none():
-            return {"status": "duplicate", "message": "Post already processed"}
-
-        # Create Post record (catch IntegrityError for concurrent duplicates)
-        post = Post(
-            tracked_page_id=matched_page.id,
-            platform=matched_page.platform,
-            external_post_id=external_post_id,
-            url=event.url,
+        if settings.webhook_post_batching:
+            post_id = await insert_post(
+                matched_page.id, matched_page.platform, external_post_id, event.url
+            )
+            if post_id is None:
+                return {"status": "duplicate", "message": "Post already processed"}
+        else:
+            # Insert and deduplicate in one round trip; concurrent duplicates hit the conflict too
+            result = await db.execute(
+                dialect_insert(db, Post)
+                .values(
+                    tracked_page_id=matched_page.id,
+                    platform=matched_page.platform,
+                    external_post_id=external_post_id,
+                    url=event.url,
+                )
+                .on_conflict_do_nothing(index_elements=[Post.external_post_id])
+                .returning(Post.id)
+            )
+            post_id = result.scalar_one_or_none()
+            if post_id is None:
+                return {"status": "duplicate", "message": "Post already processed"}
+
+        logger.info(f"New post from WhatsApp: {event.url} -> post {post_id}")
+
+        # Background tasks run before get_db commits, so commit first: the
+        # worker must be able to see the post row it is handed
+        await db.commit()
+
+        # Enqueue engagement jobs via Celery once the response is sent
+        background_tasks.add_task(
+            schedule_staggered_engagements.delay, str(post_id), str(matched_page.id)
         )
-        db.add(post)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            return {"status": "duplicate", "message": "Post already processed (concurrent)"}
-
-        logger.info(f"New post from WhatsApp: {event.url} -> post {post.id}")
-
-        # Enqueue engagement jobs via Celery
-        from app.workers.engagement_tasks import schedule_staggered_engagements
-
-        schedule_staggered_engagements.delay(str(post.id), str(matched_page.id))
 
         return {
             "status": "matched",
-            "post_id": str(post.id),
+            "post_id": str(post_id),
             "tracked_page_id": str(matched_page.id),
             "message": "Engagement jobs scheduled",
         }
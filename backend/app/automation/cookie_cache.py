@@ -0,0 +1,93 @@
+"""Stored session cookies for browser automation, with a per-process TTL cache.
+
+Workers run many actions per user, so once a user's cookies have been read they
+are served from here for COOKIE_TTL_SECONDS instead of querying per action.
+Cookie writes in this process call invalidate_session_cookies(); other processes
+pick up new cookies once the entry expires.
+"""
+
+import logging
+import time
+import uuid
+from functools import lru_cache
+
+from sqlalchemy import select
+
+from app.core.security import decrypt_json
+from app.database import reuse_task_session
+from app.models.integration import IntegrationAccount, Platform
+
+logger = logging.getLogger(__name__)
+
+COOKIE_TTL_SECONDS = 300.0
+COOKIE_CACHE_MAX_ENTRIES = 1024
+
+# (user_id, platform) -> (loaded_at, cookies), oldest entry first
+_cache: dict[tuple[str, Platform], tuple[float, list[dict]]] = {}
+
+
+def get_cached_cookies(user_id: str | uuid.UUID, platform: Platform) -> list[dict] | None:
+    """Return the user's cookies if they were cached within the TTL, else None."""
+    key = (str(user_id), platform)
+    entry = _cache.get(key)
+    if entry is None:
+        return None
+    loaded_at, cookies = entry
+    if time.monotonic() - loaded_at >= COOKIE_TTL_SECONDS:
+        del _cache[key]
+        return None
+    return cookies
+
+
+def cache_cookies(user_id: str | uuid.UUID, platform: Platform, cookies: list[dict]) -> None:
+    """Remember cookies just loaded from the database."""
+    key = (str(user_id), platform)
+    _cache.pop(key, None)
+    if len(_cache) >= COOKIE_CACHE_MAX_ENTRIES:
+        del _cache[next(iter(_cache))]
+    _cache[key] = (time.monotonic(), cookies)
+
+
+def invalidate_session_cookies(user_id: str | uuid.UUID, platform: Platform) -> None:
+    """Drop a user's cached cookies after they have been replaced."""
+    _cache.pop((str(user_id), platform), None)
+
+
+@lru_cache(maxsize=4096)
+def _to_uuid(user_id: str) -> uuid.UUID:
+    return uuid.UUID(user_id)
+
+
+async def load_session_cookies(user_id: str | uuid.UUID, platform: Platform) -> list[dict] | None:
+    """Return a user's stored cookies for ``platform``, decrypting them if needed.
+
+    Inside a Celery task this reuses the task's open session rather than
+    creating another engine for a single lookup.
+    """
+    cookies = get_cached_cookies(user_id, platform)
+    if cookies is not None:
+        return cookies
+
+    if not isinstance(user_id, uuid.UUID):
+        user_id = _to_uuid(user_id)
+
+    async with reuse_task_session() as db:
+        result = await db.execute(
+            select(IntegrationAccount.session_cookies).where(
+                IntegrationAccount.user_id == user_id,
+                IntegrationAccount.platform == platform,
+            )
+        )
+        cookies = result.scalar_one_or_none()
+
+    if not cookies:
+        return None
+    # Cookies saved through the integrations API are stored encrypted as a string
+    if isinstance(cookies, str):
+        try:
+            cookies = decrypt_json(cookies)
+        except Exception:
+            logger.warning(f"Failed to decrypt {platform.value} cookies for user {user_id}")
+            return None
+    cache_cookies(user_id, platform, cookies)
+    return cookies
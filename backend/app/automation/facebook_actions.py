@@ -1,69 +1,83 @@
 """Facebook Playwright automation for personal accounts."""
 
-import asyncio
+import contextlib
 import logging
-import random
+import re
 import uuid
+from functools import partial
 
 from playwright.async_api import Page
-
-from app.automation.browser_manager import get_browser, get_page, human_delay
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from app.automation.browser_manager import (
+    acquire_page,
+    human_delay,
+    human_insert_text,
+    human_scroll,
+    lease_scrape_page,
+    release_page,
+    wait_for_first,
+)
+from app.automation.cookie_cache import load_session_cookies
+from app.models.integration import Platform
 
 logger = logging.getLogger(__name__)
 
+_POSTS_RE = re.compile(r"/posts/(\w+)")
+_STORY_RE = re.compile(r"story_fbid=(\d+)")
+_VIDEO_RE = re.compile(r"/videos/(\d+)")
+
+# Post action selectors, including the already-liked state and the comment box reveal
+_LIKE_SELECTOR = 'div[aria-label="Like"]:not([aria-pressed="true"]), span[aria-label="Like"]'
+_LIKED_SELECTOR = 'div[aria-label="Remove Like"], div[aria-label="Like"][aria-pressed="true"]'
+_COMMENT_BOX_SELECTOR = (
+    'div[aria-label="Write a comment"], '
+    'div[aria-label="Write a comment…"], '
+    'div[contenteditable="true"][role="textbox"][aria-label*="comment" i]'
+)
+_COMMENT_TRIGGER_SELECTOR = 'div[aria-label="Leave a comment"], span:has-text("Write a comment")'
+_REVEALED_COMMENT_BOX_SELECTOR = 'div[contenteditable="true"][role="textbox"]'
+
+_POST_HREFS_JS = """
+() => Array.from(
+    document.querySelectorAll(
+        'a[href*="/posts/"], a[href*="permalink.php"], a[href*="/videos/"]'
+    )
+).slice(0, 15).map((a) => a.getAttribute("href"))
+"""
 
-async def _get_user_cookies(user_id: str) -> list[dict] | None:
-    """Load stored session cookies for a user's Meta integration."""
-    from sqlalchemy import select
-
-    from app.database import get_task_session
-    from app.models.integration import IntegrationAccount, Platform
-
-    async with get_task_session() as db:
-        result = await db.execute(
-            select(IntegrationAccount).where(
-                IntegrationAccount.user_id == uuid.UUID(user_id),
-                IntegrationAccount.platform == Platform.META,
-            )
-        )
-        integration = result.scalar_one_or_none()
-        if integration and integration.session_cookies:
-            return integration.session_cookies
-    return None
 
+async def _get_page_for_user(user_id: uuid.UUID) -> Page:
+    """Get a Playwright page with the user's Facebook session cookies.
 
-async def _get_page_for_user(user_id: str) -> Page:
-    """Get a Playwright page with the user's Facebook session cookies."""
-    cookies = await _get_user_cookies(user_id)
-    page = await get_page(user_id, cookies)
-    return page
+    Cookies come through the per-process cookie cache, so a live context only
+    goes to the database when the cache entry has expired.
+    """
+    return await acquire_page(
+        str(user_id),
+        Platform.META,
+        cookie_loader=partial(load_session_cookies, user_id, Platform.META),
+    )
 
 
-async def like_post(user_id: str, post_url: str) -> bool:
+async def like_post(user_id: uuid.UUID, post_url: str) -> bool:
     """Navigate to a Facebook post and click the like button."""
     page = await _get_page_for_user(user_id)
     try:
         logger.info(f"Liking Facebook post: {post_url}")
         await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(2, 5)
 
-        # Facebook like button
-        like_button = await page.query_selector(
-            'div[aria-label="Like"]:not([aria-pressed="true"]), span[aria-label="Like"]'
-        )
+        # Facebook like button, or the pressed one if already liked
+        state = await wait_for_first(page, _LIKE_SELECTOR, _LIKED_SELECTOR)
 
-        if like_button:
+        if state == 0:
             await human_delay(0.5, 1.5)
-            await like_button.click()
+            await page.locator(_LIKE_SELECTOR).first.click()
             await human_delay(1, 3)
             logger.info(f"Successfully liked Facebook post: {post_url}")
             return True
 
-        # Check if already liked
-        already_liked = await page.query_selector(
-            'div[aria-label="Remove Like"], div[aria-label="Like"][aria-pressed="true"]'
-        )
-        if already_liked:
+        if state == 1:
             logger.info(f"Facebook post already liked: {post_url}")
             return True
 
@@ -73,35 +87,35 @@ async def like_post(user_id: str, post_url: str) -> bool:
         logger.error(f"Error liking Facebook post {post_url}: {e}")
         raise
     finally:
-        await page.close()
+        await release_page(str(user_id), Platform.META, page)
 
 
-async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> bool:
+async def comment_on_post(user_id: uuid.UUID, post_url: str, comment_text: str) -> bool:
     """Navigate to a Facebook post and add a comment."""
     page = await _get_page_for_user(user_id)
     try:
         logger.info(f"Commenting on Facebook post: {post_url}")
         await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(2, 5)
 
-        # Find the comment input — Facebook uses contenteditable divs
-        comment_box = await page.query_selector(
-            'div[aria-label="Write a comment"], '
-            'div[aria-label="Write a comment…"], '
-            'div[contenteditable="true"][role="textbox"][aria-label*="comment" i]'
-        )
+        # Find the comment input — Facebook uses contenteditable divs — or the
+        # button/area that reveals it, waiting until one of them has rendered
+        with contextlib.suppress(PlaywrightTimeoutError):
+            await page.wait_for_selector(
+                f"{_COMMENT_BOX_SELECTOR}, {_COMMENT_TRIGGER_SELECTOR}",
+                state="attached",
+                timeout=8000,
+            )
+        await human_delay(0.3, 0.8)
+
+        comment_box = await page.query_selector(_COMMENT_BOX_SELECTOR)
 
         if not comment_box:
             # Try clicking the comment button/area to reveal the input
-            comment_trigger = await page.query_selector(
-                'div[aria-label="Leave a comment"], span:has-text("Write a comment")'
-            )
+            comment_trigger = await page.query_selector(_COMMENT_TRIGGER_SELECTOR)
             if comment_trigger:
                 await comment_trigger.click()
                 await human_delay(1, 2)
-                comment_box = await page.query_selector(
-                    'div[contenteditable="true"][role="textbox"]'
-                )
+                comment_box = await page.query_selector(_REVEALED_COMMENT_BOX_SELECTOR)
 
         if not comment_box:
             logger.error(f"Comment box not found for Facebook post: {post_url}")
@@ -111,10 +125,7 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
         await human_delay(0.5, 1.0)
 
         # Type with human-like delays
-        for char in comment_text:
-            await page.keyboard.type(char, delay=int(40 + 80 * random.random()))
-            if random.random() < 0.03:
-                await asyncio.sleep(random.uniform(0.2, 0.5))
+        await human_insert_text(page, comment_text)
 
         await human_delay(1, 3)
 
@@ -128,53 +139,39 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
         logger.error(f"Error commenting on Facebook post {post_url}: {e}")
         raise
     finally:
-        await page.close()
+        await release_page(str(user_id), Platform.META, page)
 
 
 async def scrape_page_posts(page_url: str) -> list[dict]:
     """Scrape recent posts from a Facebook page using Playwright."""
-    import re
-
-    browser = await get_browser()
-    context = await browser.new_context(
-        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        viewport={"width": 1920, "height": 1080},
-    )
-    page = await context.new_page()
-
     posts = []
     try:
-        await page.goto(page_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(3, 6)
-
-        # Scroll to load posts
-        for _ in range(3):
-            await page.evaluate("window.scrollBy(0, 800)")
-            await human_delay(1, 2)
-
-        # Extract post links
-        post_links = await page.query_selector_all(
-            'a[href*="/posts/"], a[href*="permalink.php"], a[href*="/videos/"]'
-        )
-
-        seen_ids = set()
-        for link in post_links[:15]:
-            try:
-                href = await link.get_attribute("href")
+        async with lease_scrape_page() as page:
+            await page.goto(page_url, wait_until="domcontentloaded", timeout=20000)
+            await human_delay(3, 6)
+
+            # Scroll to load posts, pausing 1-2s between steps, in a single round trip
+            await human_scroll(page, steps=3, distance=800)
+
+            # Collect the first 15 post link hrefs in one round trip
+            hrefs = await page.evaluate(_POST_HREFS_JS)
+
+            seen_ids = set()
+            for href in hrefs:
                 if not href:
                     continue
 
                 # Extract a post identifier
                 post_id = None
-                posts_match = re.search(r"/posts/(\w+)", href)
+                posts_match = _POSTS_RE.search(href)
                 if posts_match:
                     post_id = f"post_{posts_match.group(1)}"
                 else:
-                    permalink_match = re.search(r"story_fbid=(\d+)", href)
+                    permalink_match = _STORY_RE.search(href)
                     if permalink_match:
                         post_id = f"story_{permalink_match.group(1)}"
                     else:
-                        video_match = re.search(r"/videos/(\d+)", href)
+                        video_match = _VIDEO_RE.search(href)
                         if video_match:
                             post_id = f"video_{video_match.group(1)}"
 
@@ -191,15 +188,9 @@ async def scrape_page_posts(page_url: str) -> list[dict]:
                         "content": "",
                     }
                 )
-            except Exception as e:
-                logger.debug(f"Error extracting FB post element: {e}")
-                continue
 
     except Exception as e:
         logger.error(f"Error scraping Facebook page {page_url}: {e}")
-    finally:
-        await page.close()
-        await context.close()
 
     logger.info(f"Scraped {len(posts)} posts from Facebook page {page_url}")
     return posts
@@ -1,42 +1,64 @@
 """Instagram Playwright automation for personal accounts."""
 
-import asyncio
 import logging
-import random
-import uuid
+import re
+from functools import partial
 
 from playwright.async_api import Page
 
-from app.automation.browser_manager import get_browser, get_page, human_delay
+from app.automation.browser_manager import (
+    acquire_page,
+    human_delay,
+    human_insert_text,
+    human_scroll,
+    lease_scrape_page,
+    release_page,
+    wait_for_first,
+)
+from app.automation.cookie_cache import load_session_cookies
+from app.models.integration import Platform
 
 logger = logging.getLogger(__name__)
 
-
-async def _get_user_cookies(user_id: str) -> list[dict] | None:
-    """Load stored session cookies for a user's Meta integration."""
-    from sqlalchemy import select
-
-    from app.database import get_task_session
-    from app.models.integration import IntegrationAccount, Platform
-
-    async with get_task_session() as db:
-        result = await db.execute(
-            select(IntegrationAccount).where(
-                IntegrationAccount.user_id == uuid.UUID(user_id),
-                IntegrationAccount.platform == Platform.META,
-            )
-        )
-        integration = result.scalar_one_or_none()
-        if integration and integration.session_cookies:
-            return integration.session_cookies
-    return None
+_SHORTCODE_RE = re.compile(r"/(p|reel)/([A-Za-z0-9_-]+)")
+
+# The button wrapping the heart icon, or the filled heart if already liked. The bare
+# SVG is a last resort; when its button also matches, the button comes first in the DOM
+_LIKE_SELECTOR = (
+    'button[aria-label="Like"], section button:has(svg[aria-label="Like"]), '
+    'span.fr66n button, svg[aria-label="Like"]'
+)
+_LIKED_SELECTOR = 'svg[aria-label="Unlike"], span.fr66n button svg[fill="red"]'
+# The comment textarea, or the comment icon that reveals it
+_COMMENT_BOX_SELECTOR = (
+    'textarea[aria-label="Add a comment…"], '
+    'form textarea[placeholder*="comment"], '
+    'textarea[aria-label*="comment" i]'
+)
+_COMMENT_ICON_SELECTOR = (
+    'button:has(svg[aria-label="Comment"]), span._15y0l button, svg[aria-label="Comment"]'
+)
+_REVEALED_COMMENT_BOX_SELECTOR = 'textarea[aria-label*="comment" i]'
+_COMMENT_SUBMIT_SELECTOR = (
+    'button[type="submit"]:has-text("Post"), div[role="button"]:has-text("Post")'
+)
+
+_POST_HREFS_JS = """
+() => Array.from(
+    document.querySelectorAll('a[href*="/p/"], a[href*="/reel/"]')
+).slice(0, 12).map((a) => a.getAttribute("href"))
+"""
 
 
 async def _get_page_for_user(user_id: str) -> Page:
-    """Get a Playwright page with the user's Instagram session cookies."""
-    cookies = await _get_user_cookies(user_id)
-    page = await get_page(user_id, cookies)
-    return page
+    """Get a Playwright page with the user's Instagram session cookies.
+
+    Cookies come through the per-process cookie cache, so a live context only
+    goes to the database when the cache entry has expired.
+    """
+    return await acquire_page(
+        user_id, Platform.META, cookie_loader=partial(load_session_cookies, user_id, Platform.META)
+    )
 
 
 async def like_post(user_id: str, post_url: str) -> bool:
@@ -45,26 +67,17 @@ async def like_post(user_id: str, post_url: str) -> bool:
     try:
         logger.info(f"Liking Instagram post: {post_url}")
         await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(2, 5)
 
-        # Instagram like button SVG — heart icon
-        like_button = await page.query_selector(
-            'span.fr66n button, section button svg[aria-label="Like"], svg[aria-label="Like"]'
-        )
+        state = await wait_for_first(page, _LIKE_SELECTOR, _LIKED_SELECTOR)
 
-        if like_button:
-            # Click the parent button if we got the SVG
-            parent = await like_button.evaluate_handle("el => el.closest('button') || el")
-            await parent.as_element().click()
+        if state == 0:
+            await human_delay(0.3, 0.8)
+            await page.locator(_LIKE_SELECTOR).first.click()
             await human_delay(1, 3)
             logger.info(f"Successfully liked Instagram post: {post_url}")
             return True
 
-        # Check if already liked
-        already_liked = await page.query_selector(
-            'svg[aria-label="Unlike"], span.fr66n button svg[fill="red"]'
-        )
-        if already_liked:
+        if state == 1:
             logger.info(f"Instagram post already liked: {post_url}")
             return True
 
@@ -74,7 +87,7 @@ async def like_post(user_id: str, post_url: str) -> bool:
         logger.error(f"Error liking Instagram post {post_url}: {e}")
         raise
     finally:
-        await page.close()
+        await release_page(user_id, Platform.META, page)
 
 
 async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> bool:
@@ -83,25 +96,16 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
     try:
         logger.info(f"Commenting on Instagram post: {post_url}")
         await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(2, 5)
 
-        # Find the comment textarea
-        comment_box = await page.query_selector(
-            'textarea[aria-label="Add a comment…"], '
-            'form textarea[placeholder*="comment"], '
-            'textarea[aria-label*="comment" i]'
-        )
+        # Find the comment textarea, or the comment icon that reveals it
+        state = await wait_for_first(page, _COMMENT_BOX_SELECTOR, _COMMENT_ICON_SELECTOR)
+        await human_delay(0.3, 0.8)
 
-        if not comment_box:
-            # Try clicking the comment icon first
-            comment_icon = await page.query_selector(
-                'svg[aria-label="Comment"], span._15y0l button'
-            )
-            if comment_icon:
-                parent = await comment_icon.evaluate_handle("el => el.closest('button') || el")
-                await parent.as_element().click()
-                await human_delay(1, 2)
-                comment_box = await page.query_selector('textarea[aria-label*="comment" i]')
+        comment_box = page.locator(_COMMENT_BOX_SELECTOR).first if state == 0 else None
+        if state == 1:
+            await page.locator(_COMMENT_ICON_SELECTOR).first.click()
+            await human_delay(1, 2)
+            comment_box = await page.query_selector(_REVEALED_COMMENT_BOX_SELECTOR)
 
         if not comment_box:
             logger.error(f"Comment box not found for Instagram post: {post_url}")
@@ -111,17 +115,12 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
         await human_delay(0.5, 1.0)
 
         # Type with human-like delays
-        for char in comment_text:
-            await page.keyboard.type(char, delay=int(40 + 80 * random.random()))
-            if random.random() < 0.03:
-                await asyncio.sleep(random.uniform(0.2, 0.5))
+        await human_insert_text(page, comment_text)
 
         await human_delay(1, 3)
 
         # Find and click the Post button
-        post_button = await page.query_selector(
-            'button[type="submit"]:has-text("Post"), div[role="button"]:has-text("Post")'
-        )
+        post_button = await page.query_selector(_COMMENT_SUBMIT_SELECTOR)
 
         if post_button:
             await post_button.click()
@@ -139,41 +138,29 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
         logger.error(f"Error commenting on Instagram post {post_url}: {e}")
         raise
     finally:
-        await page.close()
+        await release_page(user_id, Platform.META, page)
 
 
 async def scrape_profile_posts(profile_url: str) -> list[dict]:
     """Scrape recent posts from an Instagram profile using Playwright."""
-    browser = await get_browser()
-    context = await browser.new_context(
-        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        viewport={"width": 1920, "height": 1080},
-    )
-    page = await context.new_page()
-
     posts = []
     try:
-        await page.goto(profile_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(3, 6)
+        async with lease_scrape_page() as page:
+            await page.goto(profile_url, wait_until="domcontentloaded", timeout=20000)
+            await human_delay(3, 6)
 
-        # Scroll to load posts
-        for _ in range(2):
-            await page.evaluate("window.scrollBy(0, 600)")
-            await human_delay(1, 2)
+            # Scroll to load posts, pausing 1-2s between steps, in a single round trip
+            await human_scroll(page, steps=2, distance=600)
 
-        # Extract post links from the profile grid
-        post_links = await page.query_selector_all('a[href*="/p/"], a[href*="/reel/"]')
+            # Collect the 12 most recent post link hrefs from the grid in one round trip
+            hrefs = await page.evaluate(_POST_HREFS_JS)
 
-        for link in post_links[:12]:  # Limit to 12 recent posts
-            try:
-                href = await link.get_attribute("href")
+            for href in hrefs:
                 if not href:
                     continue
 
                 # Extract shortcode from URL
-                import re
-
-                match = re.search(r"/(p|reel)/([A-Za-z0-9_-]+)", href)
+                match = _SHORTCODE_RE.search(href)
                 if not match:
                     continue
 
@@ -187,15 +174,9 @@ async def scrape_profile_posts(profile_url: str) -> list[dict]:
                         "content": "",  # Would need to click into post to get caption
                     }
                 )
-            except Exception as e:
-                logger.debug(f"Error extracting IG post element: {e}")
-                continue
 
     except Exception as e:
         logger.error(f"Error scraping Instagram profile {profile_url}: {e}")
-    finally:
-        await page.close()
-        await context.close()
 
     logger.info(f"Scraped {len(posts)} posts from Instagram profile {profile_url}")
     return posts
@@ -1,61 +1,170 @@
 import asyncio
 import logging
-import uuid
+from functools import partial
 
+import httpx
 from playwright.async_api import Page
 
-from app.automation.browser_manager import get_page, human_delay
+from app.automation.browser_manager import (
+    USER_AGENTS,
+    acquire_page,
+    get_proxy_url,
+    human_delay,
+    human_insert_text,
+    lease_scrape_page,
+    release_page,
+    wait_for_first,
+)
+from app.automation.cookie_cache import load_session_cookies
+from app.config import HTTP_TIMEOUT
+from app.models.integration import Platform
 
 logger = logging.getLogger(__name__)
 
+_FEED_URL = "https://www.linkedin.com/feed/"
+# Redirect targets meaning the session cookies are no longer accepted
+_AUTH_REDIRECT_MARKERS = ("/login", "/checkpoint", "/authwall")
+
+# Post action selectors: LinkedIn's own classes and exact attribute values first,
+# with aria-label substring matches (labels carry the author's name) as fallback
+_LIKE_SELECTOR = (
+    'button.react-button__trigger[aria-pressed="false"], '
+    'button[aria-label*="Like"]:not([aria-pressed="true"])'
+)
+_LIKED_SELECTOR = (
+    'button.react-button__trigger[aria-pressed="true"], '
+    'button[aria-label*="Like"][aria-pressed="true"]'
+)
+_COMMENT_BUTTON_SELECTOR = 'button.comment-button, button[aria-label*="Comment"]'
+_COMMENT_BOX_SELECTOR = (
+    "div.ql-editor[data-placeholder], "
+    "div.comments-comment-box__form div[contenteditable], "
+    'div[role="textbox"][contenteditable="true"]'
+)
+_COMMENT_SUBMIT_SELECTOR = (
+    'button.comments-comment-box__submit-button, button[type="submit"][class*="comment"]'
+)
+# Where the signed-in member's name can be read on the feed, most reliable first
+_PROFILE_NAME_SELECTORS = (
+    'a[href*="/in/"][data-test-nav-top-bar-profile-dropdown]',
+    'button[aria-label*="Profile"]',
+    ".feed-shared-update-v2__actor-meta a",
+)
+
+_POST_ELEMENTS_SELECTOR = (
+    'div[data-urn*="activity"], '
+    "li.profile-creator-shared-feed-update__container, "
+    "div.feed-shared-update-v2, "
+    "div.occludable-update"
+)
+_MAX_SCRAPED_POSTS = 10
+
+# Scrolls up to `steps` times, each time waiting (up to timeoutMs) for more posts
+# to render instead of a fixed pause, and stops once `target` posts are present
+_SCROLL_FOR_POSTS_JS = """
+async ([selector, target, steps, distance, timeoutMs]) => {
+    const count = () => document.querySelectorAll(selector).length;
+    for (let i = 0; i < steps && count() < target; i++) {
+        const before = count();
+        window.scrollBy(0, distance);
+        const deadline = Date.now() + timeoutMs;
+        while (count() <= before && Date.now() < deadline) {
+            await new Promise((resolve) => setTimeout(resolve, 100));
+        }
+    }
+}
+"""
+
+# Reads the first `limit` feed updates (URN, permalink and text) in a single round trip
+_POST_ELEMENTS_JS = """
+([selector, limit]) => Array.from(
+    document.querySelectorAll(selector)
+).slice(0, limit).map((el) => {
+    const link = el.querySelector('a[href*="/feed/update/"]');
+    const textEl = el.querySelector(
+        '.feed-shared-update-v2__description, '
+        + '.update-components-text, '
+        + 'span[dir="ltr"], '
+        + '.attributed-text-segment-list__content'
+    );
+    return {
+        urn: el.getAttribute("data-urn"),
+        href: link ? link.getAttribute("href") : null,
+        text: textEl ? textEl.innerText.slice(0, 2000) : "",
+    };
+})
+"""
+
+
+async def _get_page_for_user(user_id: str, cookies: list[dict] | None = None) -> Page:
+    """Get a Playwright page with the user's LinkedIn session.
+
+    Unless ``cookies`` are given they come through the per-process cookie cache,
+    so a live context only goes to the database when the cache entry has expired.
+    """
+    if cookies:
+        return await acquire_page(user_id, Platform.LINKEDIN, cookies=cookies)
+    return await acquire_page(
+        user_id,
+        Platform.LINKEDIN,
+        cookie_loader=partial(load_session_cookies, user_id, Platform.LINKEDIN),
+    )
 
-async def _get_user_cookies(user_id: str) -> list[dict] | None:
-    """Load stored session cookies for a user's LinkedIn integration."""
-    import json
-
-    from sqlalchemy import select
 
-    from app.database import get_task_session
-    from app.models.integration import IntegrationAccount, Platform
-    from app.core.security import decrypt_value
+async def _probe_session(cookies: list[dict]) -> bool | None:
+    """Probe the feed over plain HTTP with the session cookies, without a browser.
 
-    async with get_task_session() as db:
-        result = await db.execute(
-            select(IntegrationAccount).where(
-                IntegrationAccount.user_id == uuid.UUID(user_id),
-                IntegrationAccount.platform == Platform.LINKEDIN,
-            )
+    Returns True if the feed is served, False if LinkedIn redirects to a login,
+    checkpoint or auth wall page, and None when the answer is unclear (bot
+    challenges, unexpected statuses, network errors) and a browser check is needed.
+    """
+    jar = httpx.Cookies()
+    for cookie in cookies:
+        jar.set(
+            cookie["name"],
+            cookie["value"],
+            domain=cookie.get("domain", ".linkedin.com"),
+            path=cookie.get("path", "/"),
         )
-        integration = result.scalar_one_or_none()
-        if integration and integration.session_cookies:
-            # Decrypt cookies if they're encrypted (encrypted cookies are strings)
-            cookies_data = integration.session_cookies
-            if isinstance(cookies_data, str):
-                # It's encrypted
-                try:
-                    decrypted = decrypt_value(cookies_data)
-                    return json.loads(decrypted)
-                except Exception:
-                    logger.warning(f"Failed to decrypt cookies for user {user_id}")
-                    return None
-            return cookies_data
+    try:
+        async with httpx.AsyncClient(
+            cookies=jar,
+            headers={"User-Agent": USER_AGENTS[0]},
+            proxy=get_proxy_url(),
+            timeout=HTTP_TIMEOUT,
+        ) as client:
+            response = await client.head(_FEED_URL)
+    except httpx.HTTPError as e:
+        logger.debug(f"LinkedIn session probe failed: {e}")
+        return None
+
+    if response.status_code == 200:
+        return True
+    if response.is_redirect:
+        location = response.headers.get("location", "")
+        if any(marker in location for marker in _AUTH_REDIRECT_MARKERS):
+            return False
     return None
 
 
-async def _get_page_for_user(user_id: str) -> Page:
-    """Get a Playwright page with the user's LinkedIn session."""
-    cookies = await _get_user_cookies(user_id)
-    page = await get_page(user_id, cookies)
-    return page
-
+async def check_session_valid(user_id: str, cookies: list[dict] | None = None) -> bool:
+    """Check if the user's LinkedIn session is still valid.
 
-async def check_session_valid(user_id: str) -> bool:
-    """Check if the user's LinkedIn session is still valid."""
-    page = await _get_page_for_user(user_id)
+    A cheap HTTP probe answers most checks; the browser is only used when the
+    probe is inconclusive.
+    """
+    if cookies is None:
+        cookies = await load_session_cookies(user_id, Platform.LINKEDIN)
+    if cookies:
+        verdict = await _probe_session(cookies)
+        if verdict is not None:
+            if not verdict:
+                logger.warning(f"LinkedIn session expired for user {user_id}")
+            return verdict
+
+    page = await _get_page_for_user(user_id, cookies)
     try:
-        await page.goto(
-            "https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=15000
-        )
+        await page.goto(_FEED_URL, wait_until="domcontentloaded", timeout=15000)
         await human_delay(2, 4)
 
         # Check if we're redirected to login
@@ -64,65 +173,54 @@ async def check_session_valid(user_id: str) -> bool:
             return False
         return True
     finally:
-        await page.close()
+        await release_page(user_id, Platform.LINKEDIN, page)
+
+
+async def check_sessions_valid(
+    user_ids: list[str], max_parallel: int = 5
+) -> dict[str, bool | Exception]:
+    """Check several users' LinkedIn sessions concurrently on the shared browser.
+
+    At most ``max_parallel`` checks run at once. Cookies are loaded one by one up
+    front so the concurrent checks never share the caller's database session.
+    Returns each user's result, or the exception their check raised.
+    """
+    cookies = {
+        user_id: await load_session_cookies(user_id, Platform.LINKEDIN) for user_id in user_ids
+    }
+    semaphore = asyncio.Semaphore(max_parallel)
+
+    async def check(user_id: str) -> bool:
+        if not cookies[user_id]:
+            return False
+        async with semaphore:
+            return await check_session_valid(user_id, cookies[user_id])
+
+    results = await asyncio.gather(
+        *(check(user_id) for user_id in user_ids), return_exceptions=True
+    )
+    return dict(zip(user_ids, results, strict=True))
 
 
 async def validate_session_cookies(cookies: list[dict]) -> dict:
     """Validate LinkedIn session cookies by navigating to feed and checking for auth redirect.
 
+    Called from the API process, so the scraping context is not pooled: it is
+    closed as soon as validation finishes and the user's cookies don't linger.
+
     Returns a dict with:
       - valid: bool
       - user_name: str | None (display name if extracted)
       - user_id: str | None (LinkedIn user ID if extracted)
     """
-    import os
-    import random
-
-    from playwright.async_api import async_playwright
-    from app.automation.browser_manager import get_proxy_url
-
     result = {"valid": False, "user_name": None, "user_id": None}
-    pw = await async_playwright().start()
-
-    # Get proxy URL from env var
-    proxy_url = get_proxy_url()
-
-    launch_args = [
-        "--disable-blink-features=AutomationControlled",
-        "--no-sandbox",
-        "--disable-dev-shm-usage",
-    ]
-
-    browser = await pw.chromium.launch(
-        headless=True,
-        args=launch_args,
-    )
     try:
-        context_kwargs = {
-            "user_agent": random.choice(
-                [
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-                ]
-            ),
-            "viewport": {"width": 1920, "height": 1080},
-            "ignore_https_errors": True,
-        }
-
-        if proxy_url:
-            context_kwargs["proxy"] = {"server": proxy_url}
-
-        context = await browser.new_context(**context_kwargs)
-        await context.add_cookies(cookies)
-        page = await context.new_page()
-        try:
-            await page.goto(
-                "https://www.linkedin.com/feed/", wait_until="domcontentloaded", timeout=15000
-            )
+        async with lease_scrape_page(cookies, reuse=False) as page:
+            await page.goto(_FEED_URL, wait_until="domcontentloaded", timeout=15000)
             await asyncio.sleep(2)
 
             # Check if redirected to login
-            if "/login" in page.url or "/checkpoint" in page.url or "/authwall" in page.url:
+            if any(marker in page.url for marker in _AUTH_REDIRECT_MARKERS):
                 return result
 
             result["valid"] = True
@@ -130,13 +228,11 @@ async def validate_session_cookies(cookies: list[dict]) -> dict:
             # Extract user info from the page
             try:
                 # Try to find the profile name in the nav
-                profile_link = await page.query_selector(
-                    'a[href*="/in/"][data-test-nav-top-bar-profile-dropdown]'
-                )
-                if not profile_link:
-                    profile_link = await page.query_selector('button[aria-label*="Profile"]')
-                if not profile_link:
-                    profile_link = await page.query_selector(".feed-shared-update-v2__actor-meta a")
+                profile_link = None
+                for selector in _PROFILE_NAME_SELECTORS:
+                    profile_link = await page.query_selector(selector)
+                    if profile_link:
+                        break
 
                 if profile_link:
                     user_name = await profile_link.inner_text()
@@ -145,27 +241,10 @@ async def validate_session_cookies(cookies: list[dict]) -> dict:
             except Exception as e:
                 logger.debug(f"Could not extract user name: {e}")
 
-            # Try to get user ID from cookies
-            try:
-                all_cookies = await context.cookies()
-                for cookie in all_cookies:
-                    if cookie["name"] == "li_at":
-                        # The li_at value contains user info, but it's a JWT-like token
-                        # We can try to decode it to get user ID
-                        pass
-            except Exception:
-                pass
-
-            return result
-        except Exception as e:
-            logger.warning(f"Cookie validation navigation failed: {e}")
             return result
-        finally:
-            await page.close()
-            await context.close()
-    finally:
-        await browser.close()
-        await pw.stop()
+    except Exception as e:
+        logger.warning(f"Cookie validation navigation failed: {e}")
+        return result
 
 
 async def like_post(user_id: str, post_url: str) -> bool:
@@ -174,35 +253,27 @@ async def like_post(user_id: str, post_url: str) -> bool:
     try:
         logger.info(f"Liking post: {post_url}")
         await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(2, 5)
 
-        # Find the like button — LinkedIn uses various selectors
-        like_button = await page.query_selector(
-            'button[aria-label*="Like"]:not([aria-pressed="true"]), '
-            'button.react-button__trigger[aria-pressed="false"]'
-        )
+        # Find the like button — LinkedIn uses various selectors — or a pressed one
+        state = await wait_for_first(page, _LIKE_SELECTOR, _LIKED_SELECTOR)
 
-        if like_button:
+        if state == 0:
             await human_delay(0.5, 1.5)
-            await like_button.click()
+            await page.locator(_LIKE_SELECTOR).first.click()
             await human_delay(1, 3)
             logger.info(f"Successfully liked post: {post_url}")
             return True
+        elif state == 1:
+            logger.info(f"Post already liked: {post_url}")
+            return True
         else:
-            # May already be liked
-            already_liked = await page.query_selector(
-                'button[aria-label*="Like"][aria-pressed="true"]'
-            )
-            if already_liked:
-                logger.info(f"Post already liked: {post_url}")
-                return True
             logger.warning(f"Like button not found for post: {post_url}")
             return False
     except Exception as e:
         logger.error(f"Error liking post {post_url}: {e}")
         raise
     finally:
-        await page.close()
+        await release_page(user_id, Platform.LINKEDIN, page)
 
 
 async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> bool:
@@ -211,23 +282,16 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
     try:
         logger.info(f"Commenting on post: {post_url}")
         await page.goto(post_url, wait_until="domcontentloaded", timeout=20000)
-        await human_delay(2, 5)
 
-        # Click the comment button to open comment box
-        comment_button = await page.query_selector(
-            'button[aria-label*="Comment"], button.comment-button'
-        )
-        if comment_button:
-            await comment_button.click()
+        # Click the comment button to open comment box, unless the box is already open
+        state = await wait_for_first(page, _COMMENT_BUTTON_SELECTOR, _COMMENT_BOX_SELECTOR)
+        await human_delay(0.3, 0.8)
+        if state == 0:
+            await page.locator(_COMMENT_BUTTON_SELECTOR).first.click()
             await human_delay(1, 3)
 
         # Find the comment input field
-        comment_box = await page.wait_for_selector(
-            "div.ql-editor[data-placeholder], "
-            'div[role="textbox"][contenteditable="true"], '
-            "div.comments-comment-box__form div[contenteditable]",
-            timeout=10000,
-        )
+        comment_box = await page.wait_for_selector(_COMMENT_BOX_SELECTOR, timeout=10000)
 
         if not comment_box:
             logger.error(f"Comment box not found for post: {post_url}")
@@ -237,17 +301,12 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
         await comment_box.click()
         await human_delay(0.5, 1.0)
 
-        for char in comment_text:
-            await page.keyboard.type(char, delay=int(40 + 80 * __import__("random").random()))
-            if __import__("random").random() < 0.03:
-                await asyncio.sleep(__import__("random").uniform(0.2, 0.5))
+        await human_insert_text(page, comment_text)
 
         await human_delay(1, 3)
 
         # Click submit button
-        submit_button = await page.query_selector(
-            'button.comments-comment-box__submit-button, button[type="submit"][class*="comment"]'
-        )
+        submit_button = await page.query_selector(_COMMENT_SUBMIT_SELECTOR)
 
         if submit_button:
             await submit_button.click()
@@ -265,109 +324,56 @@ async def comment_on_post(user_id: str, post_url: str, comment_text: str) -> boo
         logger.error(f"Error commenting on post {post_url}: {e}")
         raise
     finally:
-        await page.close()
+        await release_page(user_id, Platform.LINKEDIN, page)
 
 
 async def scrape_profile_posts(profile_url: str, cookies: list[dict] | None = None) -> list[dict]:
     """Scrape recent posts from a LinkedIn profile or company page.
 
-    Launches a fresh Playwright browser per invocation to avoid state pollution
-    from any shared browser_manager.
+    Runs in a pooled scraping context on the shared browser. Contexts are kept
+    per cookie set until the event loop's browser is shut down (at the end of
+    run_task() in Celery), so repeat scrapes with the same session in one task
+    reuse an authenticated context instead of building one and re-adding cookies.
     """
-    import random
-
-    from playwright.async_api import async_playwright
-    from app.automation.browser_manager import get_proxy_url
-
     posts = []
-    ua = random.choice(
-        [
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
-        ]
-    )
-
-    pw = await async_playwright().start()
 
-    # Get proxy URL from env var
-    proxy_url = get_proxy_url()
+    posts_url = profile_url.rstrip("/")
+    if "/company/" in posts_url:
+        posts_url += "/posts/"
+    else:
+        posts_url += "/recent-activity/all/"
 
-    browser = await pw.chromium.launch(
-        headless=True,
-        args=[
-            "--disable-blink-features=AutomationControlled",
-            "--no-sandbox",
-            "--disable-dev-shm-usage",
-        ],
-    )
     try:
-        context_kwargs = {
-            "user_agent": ua,
-            "viewport": {"width": 1920, "height": 1080},
-            "extra_http_headers": {"Accept-Language": "en-US,en;q=0.9"},
-            "ignore_https_errors": True,
-        }
-
-        if proxy_url:
-            context_kwargs["proxy"] = {"server": proxy_url}
-
-        context = await browser.new_context(**context_kwargs)
-        # Inject cookies BEFORE the first navigation so the session is recognised
-        if cookies:
-            await context.add_cookies(cookies)
-        await context.add_init_script(
-            "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
-        )
-
-        page = await context.new_page()
+        async with lease_scrape_page(cookies) as page:
+            try:
+                await page.goto(posts_url, wait_until="domcontentloaded", timeout=30000)
+                await asyncio.sleep(3)
+            except Exception as nav_err:
+                logger.warning(f"Navigation to {posts_url} failed: {nav_err}")
+                return []
+
+            final_url = page.url
+            logger.debug(f"Final URL: {final_url}")
+            if "/login" in final_url or "/checkpoint" in final_url or "/authwall" in final_url:
+                logger.warning(
+                    f"LinkedIn auth wall detected for {profile_url} — "
+                    "li_at cookie may be expired. Go to Settings → LinkedIn → re-login."
+                )
+                return []
 
-        posts_url = profile_url.rstrip("/")
-        if "/company/" in posts_url:
-            posts_url += "/posts/"
-        else:
-            posts_url += "/recent-activity/all/"
-
-        try:
-            await page.goto(posts_url, wait_until="domcontentloaded", timeout=30000)
-            await asyncio.sleep(3)
-        except Exception as nav_err:
-            logger.warning(f"Navigation to {posts_url} failed: {nav_err}")
-            return []
-
-        final_url = page.url
-        logger.debug(f"Final URL: {final_url}")
-        if "/login" in final_url or "/checkpoint" in final_url or "/authwall" in final_url:
-            logger.warning(
-                f"LinkedIn auth wall detected for {profile_url} — "
-                "li_at cookie may be expired. Go to Settings → LinkedIn → re-login."
+            await page.evaluate(
+                _SCROLL_FOR_POSTS_JS,
+                [_POST_ELEMENTS_SELECTOR, _MAX_SCRAPED_POSTS, 3, 800, 3000],
             )
-            return []
-
-        for _ in range(3):
-            await page.evaluate("window.scrollBy(0, 800)")
-            await asyncio.sleep(1)
 
-        post_elements = await page.query_selector_all(
-            'div[data-urn*="activity"], '
-            "li.profile-creator-shared-feed-update__container, "
-            "div.feed-shared-update-v2, "
-            "div.occludable-update"
-        )
-        logger.info(f"Found {len(post_elements)} post elements on {profile_url}")
+            elements = await page.evaluate(
+                _POST_ELEMENTS_JS, [_POST_ELEMENTS_SELECTOR, _MAX_SCRAPED_POSTS]
+            )
+            logger.info(f"Found {len(elements)} post elements on {profile_url}")
 
-        for element in post_elements[:10]:
-            try:
-                link = await element.query_selector('a[href*="/feed/update/"]')
-                post_href = await link.get_attribute("href") if link else None
-                text_el = await element.query_selector(
-                    ".feed-shared-update-v2__description, "
-                    ".update-components-text, "
-                    'span[dir="ltr"], '
-                    ".attributed-text-segment-list__content"
-                )
-                text = await text_el.inner_text() if text_el else ""
-                data_urn = await element.get_attribute("data-urn")
-                external_id = data_urn or post_href or ""
+            for element in elements:
+                post_href = element["href"]
+                external_id = element["urn"] or post_href or ""
                 if external_id:
                     posts.append(
                         {
@@ -377,17 +383,12 @@ async def scrape_profile_posts(profile_url: str, cookies: list[dict] | None = No
                                 if post_href and post_href.startswith("/")
                                 else post_href or profile_url
                             ),
-                            "content": text[:2000],
+                            "content": element["text"],
                         }
                     )
-            except Exception as e:
-                logger.debug(f"Error extracting post element: {e}")
 
     except Exception as e:
         logger.error(f"Error scraping profile {profile_url}: {e}")
-    finally:
-        await browser.close()
-        await pw.stop()
 
     logger.info(f"Scraped {len(posts)} posts from {profile_url}")
     return posts
@@ -15,6 +15,14 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    # Set when connecting through pgbouncer in transaction pooling mode
+    database_pgbouncer: bool = False
+    # Connection pool per API worker process. Keep
+    # workers * (db_pool_size + db_max_overflow) under Postgres max_connections
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800  # Drop connections before server/LB idle timeouts
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
@@ -51,8 +59,13 @@ class Settings(BaseSettings):
     meta_app_secret: str = ""
     meta_redirect_uri: str = "http://localhost:8000/api/integrations/meta/callback"
 
+    # Browser automation: max scrapes running at once per worker event loop
+    scrape_max_concurrency: int = 4
+
     # WhatsApp Sidecar
     whatsapp_sidecar_url: str = "http://whatsapp-sidecar:3001"
+    # Coalesce webhook post inserts into short multi-row batches (see post_batcher)
+    webhook_post_batching: bool = False
 
     # Sentry (optional — only set in staging/production)
     sentry_dsn: str = ""
@@ -0,0 +1,55 @@
+"""Shared outbound HTTP client, one per event loop.
+
+The API server runs on one event loop for its lifetime, while each Celery task
+runs on a new loop through run_task(). Pooled connections belong to the loop
+that opened them, so every loop gets its own client, closed by whoever owns the
+loop: the app lifespan, or run_task() when the task finishes.
+"""
+
+import asyncio
+import weakref
+from http.cookiejar import DefaultCookiePolicy
+
+import httpx
+
+from app.config import HTTP_TIMEOUT
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie, request):
+        return False
+
+
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the running loop's client, so repeat calls reuse kept-alive connections.
+
+    The client serves every user, so its cookie jar never stores anything: one
+    user's session cookies must not be sent with another user's request. Each
+    response's own cookies are still readable from ``response.cookies``. Calls
+    that need a longer timeout than HTTP_TIMEOUT pass ``timeout=`` per request.
+    Callers must not close the client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=30
+            ),
+        )
+        client.cookies.jar.set_policy(_RejectCookiesPolicy())
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Close the running loop's client, if one was created."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
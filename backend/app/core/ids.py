@@ -0,0 +1,21 @@
+"""Time-ordered ids for append-heavy tables."""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUID (RFC 9562 version 7).
+
+    The leading 48 bits are the Unix time in milliseconds, so rows inserted
+    close together get neighbouring primary keys and land on the same B-tree
+    pages instead of random ones, as uuid4 keys do.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10)) >> 6  # 74 random bits
+    rand_a = rand >> 62  # 12 bits after the version
+    rand_b = rand & ((1 << 62) - 1)  # 62 bits after the variant
+    return uuid.UUID(
+        int=(unix_ms & ((1 << 48) - 1)) << 80 | 0x7 << 76 | rand_a << 64 | 0b10 << 62 | rand_b
+    )
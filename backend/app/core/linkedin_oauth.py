@@ -2,9 +2,8 @@
 
 import logging
 
-import httpx
-
-from app.config import HTTP_TIMEOUT, settings
+from app.config import settings
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -21,18 +20,17 @@ async def exchange_code_for_token(code: str, redirect_uri: str) -> dict:
     {access_token, expires_in, scope, token_type, id_token?,
      _session_cookies: list[dict]}  ← list of cookies in Playwright format
     """
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-        response = await client.post(
-            LINKEDIN_TOKEN_URL,
-            data={
-                "grant_type": "authorization_code",
-                "code": code,
-                "redirect_uri": redirect_uri,
-                "client_id": settings.linkedin_client_id,
-                "client_secret": settings.linkedin_client_secret,
-            },
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-        )
+    response = await get_http_client().post(
+        LINKEDIN_TOKEN_URL,
+        data={
+            "grant_type": "authorization_code",
+            "code": code,
+            "redirect_uri": redirect_uri,
+            "client_id": settings.linkedin_client_id,
+            "client_secret": settings.linkedin_client_secret,
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
 
     if response.status_code != 200:
         logger.error(f"LinkedIn token exchange failed: {response.text}")
@@ -64,11 +62,10 @@ async def fetch_linkedin_profile(access_token: str) -> dict:
 
     Returns: {sub, email, name, picture, email_verified, ...}
     """
-    async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-        response = await client.get(
-            LINKEDIN_USERINFO_URL,
-            headers={"Authorization": f"Bearer {access_token}"},
-        )
+    response = await get_http_client().get(
+        LINKEDIN_USERINFO_URL,
+        headers={"Authorization": f"Bearer {access_token}"},
+    )
 
     if response.status_code != 200:
         logger.error(f"LinkedIn profile fetch failed: {response.text}")
@@ -22,6 +22,7 @@ Usage with context manager:
 """
 
 import logging
+import time
 import uuid
 from contextlib import contextmanager
 from typing import Generator, Optional
@@ -33,12 +34,49 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 LOCK_PREFIX = "autoengage:user_lock:"
+LOCK_RELEASED_PREFIX = "autoengage:lock_released:"
 LOCK_TTL = 120  # Lock expires after 2 minutes if not released
 
+# Delete the lock only if we still own it, and wake one blocked waiter.
+# This prevents releasing a lock that was expired and re-acquired by another process
+_RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    redis.call("del", KEYS[1])
+    redis.call("lpush", KEYS[2], 1)
+    redis.call("expire", KEYS[2], ARGV[2])
+    return 1
+else
+    return 0
+end
+"""
+
+# Reset the lock TTL only if we still own it
+_EXTEND_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("expire", KEYS[1], ARGV[2])
+else
+    return 0
+end
+"""
+
+
+_redis_client: sync_redis.Redis | None = None
+_release_script = None
+_extend_script = None
+
 
 def get_redis() -> sync_redis.Redis:
-    """Get Redis client."""
-    return sync_redis.from_url(settings.redis_url)
+    """Get the process-wide Redis client, created on first use.
+
+    The lock scripts are registered with it at the same time; they run via
+    EVALSHA, so the script bodies are only sent to Redis once.
+    """
+    global _redis_client, _release_script, _extend_script
+    if _redis_client is None:
+        _redis_client = sync_redis.from_url(settings.redis_url)
+        _release_script = _redis_client.register_script(_RELEASE_SCRIPT)
+        _extend_script = _redis_client.register_script(_EXTEND_SCRIPT)
+    return _redis_client
 
 
 class UserLock:
@@ -52,6 +90,7 @@ class UserLock:
         self.action = action
         self.ttl = ttl
         self.lock_key = f"{LOCK_PREFIX}{action}:{user_id}"
+        self.released_key = f"{LOCK_RELEASED_PREFIX}{action}:{user_id}"
         self._redis: Optional[sync_redis.Redis] = None
         self._lock_id = str(uuid.uuid4())
         self._acquired = False
@@ -73,14 +112,16 @@ class UserLock:
             True if lock acquired, False otherwise
         """
         if blocking:
-            import time
-
-            start_time = time.time()
-            while time.time() - start_time < timeout:
+            deadline = time.monotonic() + timeout
+            while True:
                 if self._try_acquire():
                     return True
-                time.sleep(1)
-            return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                # Wake as soon as the holder releases; the 1s cap still
+                # notices locks that simply expired
+                self.redis.blpop([self.released_key], timeout=min(remaining, 1.0))
         else:
             return self._try_acquire()
 
@@ -106,17 +147,13 @@ class UserLock:
         if not self._acquired:
             return False
 
-        # Lua script to atomically check and delete
-        # This prevents releasing a lock that was expired and re-acquired by another process
-        lua_script = """
-        if redis.call("get", KEYS[1]) == ARGV[1] then
-            return redis.call("del", KEYS[1])
-        else
-            return 0
-        end
-        """
         try:
-            result = self.redis.eval(lua_script, 1, self.lock_key, self._lock_id)
+            client = self.redis  # Also registers the lock scripts on first use
+            result = _release_script(
+                keys=[self.lock_key, self.released_key],
+                args=[self._lock_id, self.ttl],
+                client=client,
+            )
             self._acquired = not bool(result)
             if result:
                 logger.debug(f"Released lock {self.lock_key}")
@@ -131,16 +168,12 @@ class UserLock:
         Returns:
             True if extended, False otherwise
         """
-        lua_script = """
-        if redis.call("get", KEYS[1]) == ARGV[1] then
-            return redis.call("expire", KEYS[1], ARGV[2])
-        else
-            return 0
-        end
-        """
         try:
-            result = self.redis.eval(
-                lua_script, 1, self.lock_key, self._lock_id, self.ttl + additional_time
+            client = self.redis  # Also registers the lock scripts on first use
+            result = _extend_script(
+                keys=[self.lock_key],
+                args=[self._lock_id, self.ttl + additional_time],
+                client=client,
             )
             return bool(result)
         except Exception as e:
@@ -191,5 +224,4 @@ def is_user_locked(user_id: str, action: str) -> bool:
     Returns:
         True if lock exists, False otherwise
     """
-    lock = UserLock(user_id, action)
-    return lock.redis.exists(lock.lock_key) > 0
+    return get_redis().exists(f"{LOCK_PREFIX}{action}:{user_id}") > 0
@@ -7,6 +7,7 @@ stored in Redis with a short TTL for single-use validation.
 import logging
 import secrets
 
+import orjson
 import redis.asyncio as aioredis
 
 from app.config import settings
@@ -17,32 +18,38 @@ OAUTH_STATE_PREFIX = "oauth_state:"
 OAUTH_STATE_TTL = 600  # 10 minutes
 
 
-async def _get_redis() -> aioredis.Redis:
-    return aioredis.from_url(settings.redis_url, decode_responses=True)
+_redis_client: aioredis.Redis | None = None
+
+
+def _get_redis() -> aioredis.Redis:
+    """Return a process-wide Redis client (one connection pool), created on first use."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = aioredis.from_url(
+            settings.redis_url, decode_responses=True, max_connections=32
+        )
+    return _redis_client
+
+
+async def close_redis() -> None:
+    """Close the shared client's connections; called on app shutdown."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
 
 
 async def create_oauth_state(user_id: str) -> str:
     """Generate a secure random state token and store user_id mapping in Redis."""
     state = secrets.token_urlsafe(32)
-    r = await _get_redis()
-    try:
-        await r.setex(f"{OAUTH_STATE_PREFIX}{state}", OAUTH_STATE_TTL, user_id)
-    finally:
-        await r.aclose()
+    await _get_redis().setex(f"{OAUTH_STATE_PREFIX}{state}", OAUTH_STATE_TTL, user_id)
     return state
 
 
 async def validate_oauth_state(state: str) -> str | None:
     """Validate and consume an OAuth state token. Returns user_id or None."""
-    r = await _get_redis()
-    try:
-        key = f"{OAUTH_STATE_PREFIX}{state}"
-        user_id = await r.get(key)
-        if user_id:
-            await r.delete(key)  # Single-use: consume immediately
-        return user_id
-    finally:
-        await r.aclose()
+    # Single-use: read and consume atomically, so concurrent callbacks can't both succeed
+    return await _get_redis().getdel(f"{OAUTH_STATE_PREFIX}{state}")
 
 
 # --- JSON-payload variants for auth flow (stores structured data) ---
@@ -53,28 +60,14 @@ AUTH_STATE_TTL = 600  # 10 minutes
 
 async def create_auth_oauth_state(payload: dict) -> str:
     """Generate a secure state token and store a JSON payload in Redis."""
-    import json
-
     state = secrets.token_urlsafe(32)
-    r = await _get_redis()
-    try:
-        await r.setex(f"{AUTH_STATE_PREFIX}{state}", AUTH_STATE_TTL, json.dumps(payload))
-    finally:
-        await r.aclose()
+    await _get_redis().setex(f"{AUTH_STATE_PREFIX}{state}", AUTH_STATE_TTL, orjson.dumps(payload))
     return state
 
 
 async def validate_auth_oauth_state(state: str) -> dict | None:
     """Validate and consume an auth state token. Returns the payload dict or None."""
-    import json
-
-    r = await _get_redis()
-    try:
-        key = f"{AUTH_STATE_PREFIX}{state}"
-        data = await r.get(key)
-        if data:
-            await r.delete(key)
-            return json.loads(data)
-        return None
-    finally:
-        await r.aclose()
+    data = await _get_redis().getdel(f"{AUTH_STATE_PREFIX}{state}")
+    if data:
+        return orjson.loads(data)
+    return None
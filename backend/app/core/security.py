@@ -1,5 +1,6 @@
 from datetime import UTC, datetime, timedelta
 
+import orjson
 from cryptography.fernet import Fernet
 from jose import JWTError, jwt
 
@@ -36,3 +37,17 @@ def encrypt_value(value: str) -> str:
 
 def decrypt_value(encrypted_value: str) -> str:
     return fernet.decrypt(encrypted_value.encode()).decode()
+
+
+def encrypt_json(value) -> str:
+    """Encrypt a JSON-serializable value (e.g. session cookies) for a text column.
+
+    Serializes straight to bytes, skipping the str round trip of
+    encrypt_value(json.dumps(value)); the stored format is the same.
+    """
+    return fernet.encrypt(orjson.dumps(value)).decode()
+
+
+def decrypt_json(encrypted_value: str):
+    """Decrypt a value stored by encrypt_json (or encrypt_value of a JSON string)."""
+    return orjson.loads(fernet.decrypt(encrypted_value))
@@ -1,17 +1,60 @@
-from collections.abc import AsyncGenerator
+import asyncio
+import sys
+from collections.abc import AsyncGenerator, Coroutine
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import orjson
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import NullPool
 
 from app.config import settings
+from app.core.http_client import close_http_client
+
+
+def _json_dumps(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+# JSON/JSONB columns are encoded and decoded with orjson rather than stdlib json
+_JSON_CODEC = {"json_serializer": _json_dumps, "json_deserializer": orjson.loads}
+
+
+def _engine_pool_kwargs() -> dict:
+    """Pool settings for the web server engine.
+
+    Behind pgbouncer (transaction pooling) pgbouncer owns the pool, so we skip
+    client-side pooling and disable asyncpg's prepared statement cache, which
+    does not survive server connection switches.
+    """
+    if settings.database_pgbouncer:
+        return {"poolclass": NullPool, "connect_args": {"statement_cache_size": 0}}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        # Reuse the most recently returned connection so a small warm set serves
+        # steady traffic and the surplus idles until pool_recycle retires it
+        "pool_use_lifo": True,
+        # Recycling bounds connection age instead of a SELECT 1 before every checkout
+        "pool_recycle": settings.db_pool_recycle,
+    }
+
 
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.app_env == "development",
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    # SQL is logged through the "sqlalchemy.engine" logger (INFO in development), so
+    # statements go through the queued log handler rather than echo's own stdout handler
+    echo=False,
+    **_engine_pool_kwargs(),
+    **_JSON_CODEC,
 )
 
 async_session_factory = async_sessionmaker(
@@ -25,11 +68,33 @@ class Base(DeclarativeBase):
     pass
 
 
+# Engine shared by every get_task_session() block inside one run_task() call
+_task_engine: ContextVar[AsyncEngine | None] = ContextVar("_task_engine", default=None)
+
+# Session opened by the innermost get_task_session() block, for reuse_task_session()
+current_task_session: ContextVar[AsyncSession | None] = ContextVar(
+    "current_task_session", default=None
+)
+
+
+def dialect_insert(db: AsyncSession, model):
+    """Return an INSERT for ``model`` that supports ``on_conflict_do_nothing``.
+
+    Production runs on PostgreSQL; the test suite runs on SQLite, which
+    offers the same ON CONFLICT construct through its own dialect.
+    """
+    if db.bind.dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         try:
             yield session
-            await session.commit()
+            # Requests that never touched the database have nothing to commit
+            if session.in_transaction():
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -37,29 +102,87 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def _create_task_engine(pooled: bool) -> AsyncEngine:
+    """Build an engine for a Celery task's event loop.
+
+    A task engine lives no longer than one task, so its connections are never
+    old enough to need pre-ping. Only the engine shared through run_task() is
+    pooled; a one-off session's engine uses NullPool and just holds the one
+    connection it opens.
+    """
+    if settings.database_pgbouncer:
+        pool_kwargs = _engine_pool_kwargs()
+    elif not pooled:
+        pool_kwargs = {"poolclass": NullPool}
+    else:
+        pool_kwargs = {"pool_size": 2, "max_overflow": 5, "pool_use_lifo": True}
+    return create_async_engine(settings.database_url, echo=False, **pool_kwargs, **_JSON_CODEC)
+
+
+def run_task(coro: Coroutine):
+    """Run a Celery task's coroutine on a new event loop, like asyncio.run().
+
+    Every get_task_session() inside it shares one engine, so the dialect
+    setup and connections are paid for once per task rather than per session.
+    The engine, the loop's shared HTTP client and, if the task used it, the
+    Playwright browser are closed before the loop closes.
+    """
+
+    async def runner():
+        task_engine = _create_task_engine(pooled=True)
+        token = _task_engine.set(task_engine)
+        try:
+            return await coro
+        finally:
+            _task_engine.reset(token)
+            await task_engine.dispose()
+            await close_http_client()
+            # Playwright objects belong to this loop; only tasks that drove a
+            # browser have imported the module (Playwright is optional elsewhere)
+            browser_manager = sys.modules.get("app.automation.browser_manager")
+            if browser_manager is not None:
+                await browser_manager.shutdown_browser()
+
+    return asyncio.run(runner())
+
+
 @asynccontextmanager
 async def get_task_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a fresh engine + session for Celery tasks.
+    """Create a session for Celery tasks.
 
-    Celery tasks use asyncio.run() which creates a new event loop each time.
-    The global engine is bound to the web server's loop, so we need a fresh
-    engine per task to avoid 'attached to a different loop' errors.
+    Celery tasks run on a new event loop each time. The global engine is bound
+    to the web server's loop, so tasks need their own engine to avoid
+    'attached to a different loop' errors. Inside run_task() the task's shared
+    engine is used; otherwise a fresh engine is built and disposed per session.
     """
-    task_engine = create_async_engine(
-        settings.database_url,
-        echo=False,
-        pool_pre_ping=True,
-        pool_size=2,
-        max_overflow=5,
-    )
+    shared_engine = _task_engine.get()
+    task_engine = shared_engine or _create_task_engine(pooled=False)
     factory = async_sessionmaker(
         task_engine,
         class_=AsyncSession,
         expire_on_commit=False,
     )
     async with factory() as session:
+        token = current_task_session.set(session)
         try:
             yield session
         finally:
+            current_task_session.reset(token)
             await session.close()
-    await task_engine.dispose()
+    if shared_engine is None:
+        await task_engine.dispose()
+
+
+@asynccontextmanager
+async def reuse_task_session() -> AsyncGenerator[AsyncSession, None]:
+    """Yield the running task's session, or a fresh task session if there is none.
+
+    Helpers called from inside a task's get_task_session() block use this to
+    share its connection instead of building another engine and session.
+    """
+    session = current_task_session.get()
+    if session is not None:
+        yield session
+        return
+    async with get_task_session() as session:
+        yield session
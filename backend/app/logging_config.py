@@ -1,17 +1,41 @@
 """Structured logging configuration for B2B Pulse."""
 
-import json
+import atexit
 import logging
+import queue
 import sys
-from datetime import UTC, datetime
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+# Extra fields passed via ``extra=`` that are copied into JSON log entries
+_EXTRA_KEYS = ("user_id", "request_id", "org_id", "task_id")
 
 
 class JSONFormatter(logging.Formatter):
     """JSON log formatter for production environments."""
 
+    def __init__(self):
+        super().__init__()
+        self._cached_second = -1
+        self._cached_prefix = ""
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        """Format the record's creation time as ISO 8601 UTC with milliseconds.
+
+        The date/time part only changes once a second, so it is reused between
+        records instead of building a datetime per record.
+        """
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        return f"{self._cached_prefix}.{int(record.msecs):03d}Z"
+
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -23,22 +47,56 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info and record.exc_info[0] is not None:
             log_entry["exception"] = self.formatException(record.exc_info)
 
-        # Include extra fields (user_id, request_id, etc.)
-        for key in ("user_id", "request_id", "org_id", "task_id"):
-            if hasattr(record, key):
-                log_entry[key] = getattr(record, key)
+        # Include extra fields (user_id, request_id, etc.). Looking up the few known
+        # keys is cheaper than diffing every record attribute against the standard set.
+        fields = record.__dict__
+        for key in _EXTRA_KEYS:
+            if key in fields:
+                log_entry[key] = fields[key]
+
+        return orjson.dumps(log_entry, default=str).decode()
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for a listener in this process.
 
-        return json.dumps(log_entry, default=str)
+    The stock prepare() formats each record up front so it can be pickled;
+    records here never leave the process, so formatting is left to the
+    listener thread as well.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: QueueListener | None = None
+
+
+def _stop_listener() -> None:
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_logging(app_env: str = "development", log_level: str = "INFO") -> None:
-    """Configure root logger based on environment."""
+    """Configure root logger based on environment.
+
+    Log calls only enqueue the record; a listener thread formats it and writes
+    to stdout, so request handlers never block on the write.
+    """
+    global _listener
     root = logging.getLogger()
     root.setLevel(log_level)
 
     # Clear existing handlers
     for handler in root.handlers[:]:
         root.removeHandler(handler)
+    _stop_listener()
 
     handler = logging.StreamHandler(sys.stdout)
 
@@ -52,7 +110,10 @@ def setup_logging(app_env: str = "development", log_level: str = "INFO") -> None
             )
         )
 
-    root.addHandler(handler)
+    log_queue = queue.SimpleQueue()
+    root.addHandler(_LocalQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
 
     # Quieter third-party loggers
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -1,17 +1,117 @@
 import logging
+import sys
+import time
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
 
 from app.api import api_router
 from app.config import settings
+from app.core.http_client import close_http_client
+from app.core.oauth_state import close_redis
 from app.logging_config import setup_logging
+from app.services.post_batcher import stop_post_batcher
 
 logger = logging.getLogger(__name__)
 
 
+class ConditionalCORSMiddleware:
+    """CORSMiddleware that only runs for requests carrying an Origin header.
+
+    Same-origin and server-to-server requests (load balancer probes, webhooks)
+    have no Origin header, so they go straight to the app. Their responses
+    still carry ``Vary: Origin``, so a shared cache never serves one of them
+    to a cross-origin request that needs the CORS headers.
+    """
+
+    def __init__(self, app, **cors_options):
+        self.app = app
+        self.cors_app = CORSMiddleware(app, **cors_options)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        for name, _ in scope["headers"]:
+            if name == b"origin":
+                await self.cors_app(scope, receive, send)
+                return
+
+        async def send_with_vary(message):
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).add_vary_header("Origin")
+            await send(message)
+
+        await self.app(scope, receive, send_with_vary)
+
+
+# A burst of identical failures logs one traceback per signature per window
+TRACEBACK_INTERVAL_SECONDS = 5.0
+TRACEBACK_SIGNATURES_MAX = 256
+
+# (exception type, file, line) -> (last traceback logged at, repeats since then)
+_traceback_signatures: dict[tuple[str, str, int], tuple[float, int]] = {}
+
+
+def _traceback_due(exc: Exception) -> tuple[bool, int]:
+    """Return whether to log exc's traceback, and how many repeats were logged without one.
+
+    Exceptions are grouped by type and the line that raised them, so a spike of
+    500s from one cause formats a single traceback per window instead of one per
+    request.
+    """
+    tb = exc.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    if tb is None:
+        key = (type(exc).__name__, "", 0)
+    else:
+        key = (type(exc).__name__, tb.tb_frame.f_code.co_filename, tb.tb_lineno)
+
+    now = time.monotonic()
+    entry = _traceback_signatures.get(key)
+    if entry is not None and now - entry[0] < TRACEBACK_INTERVAL_SECONDS:
+        _traceback_signatures[key] = (entry[0], entry[1] + 1)
+        return False, entry[1] + 1
+
+    suppressed = entry[1] if entry is not None else 0
+    _traceback_signatures.pop(key, None)
+    if len(_traceback_signatures) >= TRACEBACK_SIGNATURES_MAX:
+        del _traceback_signatures[next(iter(_traceback_signatures))]
+    _traceback_signatures[key] = (now, 0)
+    return True, suppressed
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of stdlib json.
+
+    Used for responses built by hand, like the error handlers. Routes with a
+    response_model keep FastAPI's default class, which serializes them straight
+    to bytes with Pydantic.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await stop_post_batcher()
+    await close_redis()
+    await close_http_client()
+    # Cookie validation launches Chromium in this process on first use; the
+    # module is only imported then, and Playwright may not be installed here
+    browser_manager = sys.modules.get("app.automation.browser_manager")
+    if browser_manager is not None:
+        await browser_manager.shutdown_browser()
+
+
 def create_app() -> FastAPI:
     # Configure logging first
     setup_logging(app_env=settings.app_env, log_level=settings.log_level)
@@ -40,10 +140,11 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     app.add_middleware(
-        CORSMiddleware,
+        ConditionalCORSMiddleware,
         allow_origins=settings.cors_origin_list,
         allow_credentials=True,
         allow_methods=["*"],
@@ -54,24 +155,36 @@ def create_app() -> FastAPI:
 
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
-        logger.error(
-            f"Unhandled exception on {request.method} {request.url.path}: {exc}", exc_info=True
-        )
-        return JSONResponse(
+        log_traceback, repeats = _traceback_due(exc)
+        if log_traceback:
+            suffix = f" ({repeats} repeats since last traceback)" if repeats else ""
+            logger.error(
+                f"Unhandled exception on {request.method} {request.url.path}: {exc}{suffix}",
+                exc_info=True,
+            )
+        else:
+            logger.error(
+                f"Unhandled exception on {request.method} {request.url.path}: {exc!r} "
+                f"(repeat {repeats}, traceback suppressed)"
+            )
+        return ORJSONResponse(
             status_code=500,
             content={"detail": "Internal server error"},
         )
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
             content={"detail": exc.errors()},
         )
 
+    # Load balancer probes hit this constantly, so the body is encoded once up front
+    health_body = orjson.dumps({"status": "healthy", "app": settings.app_name, "version": "0.1.0"})
+
     @app.get("/health")
     async def health_check():
-        return {"status": "healthy", "app": settings.app_name, "version": "0.1.0"}
+        return Response(content=health_body, media_type="application/json")
 
     logger.info(f"B2B Pulse started (env={settings.app_env})")
     return app
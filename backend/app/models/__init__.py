@@ -4,7 +4,7 @@ from app.models.invite import OrgInvite
 from app.models.org import Org
 from app.models.post import Post
 from app.models.team import Team
-from app.models.tracked_page import TrackedPage, TrackedPageSubscription
+from app.models.tracked_page import TrackedPage, TrackedPagePollState, TrackedPageSubscription
 from app.models.user import User, UserProfile
 
 __all__ = [
@@ -15,6 +15,7 @@ __all__ = [
     "IntegrationAccount",
     "TrackedPage",
     "TrackedPageSubscription",
+    "TrackedPagePollState",
     "Post",
     "EngagementAction",
     "AuditLog",
@@ -2,10 +2,11 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 
 
@@ -23,8 +24,12 @@ class ActionStatus(str, enum.Enum):
 
 class EngagementAction(Base):
     __tablename__ = "engagement_actions"
+    __table_args__ = (
+        Index("ix_engagement_actions_post_user", "post_id", "user_id"),
+        Index("ix_engagement_actions_user_type_created", "user_id", "action_type", "created_at"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     post_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), nullable=False
     )
@@ -50,14 +55,14 @@ class EngagementAction(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    post: Mapped["Post"] = relationship(back_populates="engagement_actions")  # noqa: F821
-    user: Mapped["User"] = relationship(back_populates="engagement_actions")  # noqa: F821
+    post: Mapped["Post"] = relationship(back_populates="engagement_actions", lazy="raise_on_sql")  # noqa: F821
+    user: Mapped["User"] = relationship(back_populates="engagement_actions", lazy="raise_on_sql")  # noqa: F821
 
 
 class AuditLog(Base):
     __tablename__ = "audit_log"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     org_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("orgs.id"), nullable=False
     )
@@ -73,7 +78,7 @@ class AuditLog(Base):
     )
 
     # Relationships
-    org: Mapped["Org"] = relationship(back_populates="audit_logs")  # noqa: F821
+    org: Mapped["Org"] = relationship(back_populates="audit_logs", lazy="raise_on_sql")  # noqa: F821
 
 
 class AIAvoidPhrase(Base):
@@ -47,4 +47,4 @@ class IntegrationAccount(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    user: Mapped["User"] = relationship(back_populates="integration_accounts")  # noqa: F821
+    user: Mapped["User"] = relationship(back_populates="integration_accounts", lazy="raise_on_sql")  # noqa: F821
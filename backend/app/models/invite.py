@@ -44,6 +44,6 @@ class OrgInvite(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    org: Mapped["Org"] = relationship()  # noqa: F821
-    inviter: Mapped["User"] = relationship(foreign_keys=[invited_by])  # noqa: F821
-    team: Mapped["Team | None"] = relationship()  # noqa: F821
+    org: Mapped["Org"] = relationship(lazy="raise_on_sql")  # noqa: F821
+    inviter: Mapped["User"] = relationship(foreign_keys=[invited_by], lazy="raise_on_sql")  # noqa: F821
+    team: Mapped["Team | None"] = relationship(lazy="raise_on_sql")  # noqa: F821
@@ -16,7 +16,9 @@ class Org(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    users: Mapped[list["User"]] = relationship(back_populates="org")  # noqa: F821
-    tracked_pages: Mapped[list["TrackedPage"]] = relationship(back_populates="org")  # noqa: F821
-    audit_logs: Mapped[list["AuditLog"]] = relationship(back_populates="org")  # noqa: F821
-    teams: Mapped[list["Team"]] = relationship(back_populates="org")  # noqa: F821
+    users: Mapped[list["User"]] = relationship(back_populates="org", lazy="raise_on_sql")  # noqa: F821
+    tracked_pages: Mapped[list["TrackedPage"]] = relationship(  # noqa: F821
+        back_populates="org", lazy="raise_on_sql"
+    )
+    audit_logs: Mapped[list["AuditLog"]] = relationship(back_populates="org", lazy="raise_on_sql")  # noqa: F821
+    teams: Mapped[list["Team"]] = relationship(back_populates="org", lazy="raise_on_sql")  # noqa: F821
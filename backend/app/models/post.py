@@ -5,6 +5,7 @@ from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from app.core.ids import uuid7
 from app.database import Base
 from app.models.integration import Platform
 
@@ -15,7 +16,7 @@ __all__ = ["Post", "Platform"]
 class Post(Base):
     __tablename__ = "posts"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     tracked_page_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), ForeignKey("tracked_pages.id", ondelete="CASCADE"), nullable=False
     )
@@ -35,7 +36,7 @@ class Post(Base):
     )
 
     # Relationships
-    tracked_page: Mapped["TrackedPage"] = relationship(back_populates="posts")  # noqa: F821
+    tracked_page: Mapped["TrackedPage"] = relationship(back_populates="posts", lazy="raise_on_sql")  # noqa: F821
     engagement_actions: Mapped[list["EngagementAction"]] = relationship(  # noqa: F821
-        back_populates="post"
+        back_populates="post", lazy="raise_on_sql", passive_deletes=True
     )
@@ -19,5 +19,7 @@ class Team(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    org: Mapped["Org"] = relationship(back_populates="teams")  # noqa: F821
-    members: Mapped[list["User"]] = relationship(back_populates="team")  # noqa: F821
+    org: Mapped["Org"] = relationship(back_populates="teams", lazy="raise_on_sql")  # noqa: F821
+    members: Mapped[list["User"]] = relationship(  # noqa: F821
+        back_populates="team", lazy="raise_on_sql", passive_deletes=True
+    )
@@ -2,7 +2,15 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, String, UniqueConstraint, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Enum,
+    ForeignKey,
+    String,
+    UniqueConstraint,
+    func,
+)
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,16 +49,49 @@ class TrackedPage(Base):
         default=PageType.PERSONAL,
     )
     active: Mapped[bool] = mapped_column(Boolean, default=True)
-    last_polled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
-    last_poll_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    org: Mapped["Org"] = relationship(back_populates="tracked_pages")  # noqa: F821
+    org: Mapped["Org"] = relationship(back_populates="tracked_pages", lazy="raise_on_sql")  # noqa: F821
     subscriptions: Mapped[list["TrackedPageSubscription"]] = relationship(
-        back_populates="tracked_page", cascade="all, delete-orphan"
+        back_populates="tracked_page",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+    posts: Mapped[list["Post"]] = relationship(  # noqa: F821
+        back_populates="tracked_page", lazy="raise_on_sql", passive_deletes=True
+    )
+    poll_state: Mapped["TrackedPagePollState | None"] = relationship(
+        back_populates="tracked_page",
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+
+
+class TrackedPagePollState(Base):
+    """Result of a tracked page's most recent poll.
+
+    Every poll rewrites this row, so it lives apart from tracked_pages: the
+    update produces a small new row version instead of one carrying the page's
+    URL and settings.
+    """
+
+    __tablename__ = "tracked_page_poll_state"
+
+    tracked_page_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("tracked_pages.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    last_polled_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_poll_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
+
+    # Relationships
+    tracked_page: Mapped["TrackedPage"] = relationship(
+        back_populates="poll_state", lazy="raise_on_sql"
     )
-    posts: Mapped[list["Post"]] = relationship(back_populates="tracked_page")  # noqa: F821
 
 
 class TrackedPageSubscription(Base):
@@ -77,5 +118,7 @@ class TrackedPageSubscription(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    tracked_page: Mapped["TrackedPage"] = relationship(back_populates="subscriptions")
-    user: Mapped["User"] = relationship(back_populates="subscriptions")  # noqa: F821
+    tracked_page: Mapped["TrackedPage"] = relationship(
+        back_populates="subscriptions", lazy="raise_on_sql"
+    )
+    user: Mapped["User"] = relationship(back_populates="subscriptions", lazy="raise_on_sql")  # noqa: F821
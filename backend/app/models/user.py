@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,6 +19,9 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_team_id_active", "team_id", postgresql_where=text("is_active = true")),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     org_id: Mapped[uuid.UUID] = mapped_column(
@@ -41,20 +44,24 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
-    org: Mapped["Org"] = relationship(back_populates="users")  # noqa: F821
+    org: Mapped["Org"] = relationship(back_populates="users", lazy="raise_on_sql")  # noqa: F821
     profile: Mapped["UserProfile | None"] = relationship(
-        back_populates="user", uselist=False, cascade="all, delete-orphan"
+        back_populates="user",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
     integration_accounts: Mapped[list["IntegrationAccount"]] = relationship(  # noqa: F821
-        back_populates="user"
+        back_populates="user", lazy="raise_on_sql", passive_deletes=True
     )
     subscriptions: Mapped[list["TrackedPageSubscription"]] = relationship(  # noqa: F821
-        back_populates="user"
+        back_populates="user", lazy="raise_on_sql", passive_deletes=True
     )
     engagement_actions: Mapped[list["EngagementAction"]] = relationship(  # noqa: F821
-        back_populates="user"
+        back_populates="user", lazy="raise_on_sql", passive_deletes=True
     )
-    team: Mapped["Team | None"] = relationship(back_populates="members")  # noqa: F821
+    team: Mapped["Team | None"] = relationship(back_populates="members", lazy="raise_on_sql")  # noqa: F821
 
 
 class UserProfile(Base):
@@ -71,4 +78,4 @@ class UserProfile(Base):
     )
 
     # Relationships
-    user: Mapped["User"] = relationship(back_populates="profile")
+    user: Mapped["User"] = relationship(back_populates="profile", lazy="raise_on_sql")
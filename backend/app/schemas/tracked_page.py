@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import AliasPath, BaseModel, Field
 
 
 class TrackedPageCreate(BaseModel):
@@ -24,8 +24,13 @@ class TrackedPageResponse(BaseModel):
     name: str
     page_type: str
     active: bool
-    last_polled_at: datetime | None = None
-    last_poll_status: str | None = None
+    # Read from the page's poll_state when it has been loaded with the page
+    last_polled_at: datetime | None = Field(
+        None, validation_alias=AliasPath("poll_state", "last_polled_at")
+    )
+    last_poll_status: str | None = Field(
+        None, validation_alias=AliasPath("poll_state", "last_poll_status")
+    )
 
     model_config = {"from_attributes": True}
 
@@ -1,13 +1,18 @@
+import json
 import logging
-
-import httpx
+import re
 
 from app.config import LLM_TIMEOUT, settings
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
 OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
 
+# Markdown code fences the model sometimes wraps its JSON in
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*")
+_FENCE_CLOSE_RE = re.compile(r"\s*```$")
+
 DEFAULT_AVOID_PHRASES = [
     "thanks for sharing",
     "great insights",
@@ -89,26 +94,48 @@ If it fails any check, respond: {{"passed": false, "notes": "explanation", "rewr
 """
 
 
+def _with_cached_system_prompt(model: str, messages: list[dict]) -> list[dict]:
+    """Mark system prompts as a prompt cache breakpoint for Anthropic models.
+
+    A user's generation prompt is the same for every post they engage with, so
+    repeat calls can be served from Anthropic's prompt cache. Prompts shorter
+    than the model's minimum cacheable length are simply not cached.
+    """
+    if not model.startswith("anthropic/"):
+        return messages
+    return [
+        {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": m["content"], "cache_control": {"type": "ephemeral"}}
+            ],
+        }
+        if m["role"] == "system"
+        else m
+        for m in messages
+    ]
+
+
 async def _call_openrouter(model: str, messages: list[dict]) -> dict:
     """Make a call to OpenRouter API."""
-    async with httpx.AsyncClient(timeout=LLM_TIMEOUT) as client:
-        response = await client.post(
-            OPENROUTER_URL,
-            json={
-                "model": model,
-                "messages": messages,
-                "temperature": 0.8,
-                "max_tokens": 500,
-            },
-            headers={
-                "Authorization": f"Bearer {settings.openrouter_api_key}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://b2bpulse.app",
-                "X-Title": "B2B Pulse",
-            },
-        )
-        response.raise_for_status()
-        return response.json()
+    response = await get_http_client().post(
+        OPENROUTER_URL,
+        json={
+            "model": model,
+            "messages": _with_cached_system_prompt(model, messages),
+            "temperature": 0.8,
+            "max_tokens": 500,
+        },
+        headers={
+            "Authorization": f"Bearer {settings.openrouter_api_key}",
+            "Content-Type": "application/json",
+            "HTTP-Referer": "https://b2bpulse.app",
+            "X-Title": "B2B Pulse",
+        },
+        timeout=LLM_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.json()
 
 
 async def generate_comments(
@@ -169,11 +196,8 @@ async def generate_comments(
     content = result["choices"][0]["message"]["content"]
 
     # Parse JSON response (strip markdown code fences if present)
-    import json
-    import re as _re
-
-    cleaned = _re.sub(r"^```(?:json)?\s*", "", content.strip())
-    cleaned = _re.sub(r"\s*```$", "", cleaned)
+    cleaned = _FENCE_OPEN_RE.sub("", content.strip())
+    cleaned = _FENCE_CLOSE_RE.sub("", cleaned)
     try:
         parsed = json.loads(cleaned)
         comments = parsed.get("comments", [cleaned])
@@ -206,8 +230,6 @@ async def review_comment(
     result = await _call_openrouter(settings.openrouter_review_model, messages)
     content = result["choices"][0]["message"]["content"]
 
-    import json
-
     try:
         parsed = json.loads(content)
         return {
@@ -12,51 +12,51 @@ logger = logging.getLogger(__name__)
 
 async def get_instagram_business_account(access_token: str, fb_page_id: str) -> str | None:
     """Get the Instagram Business Account ID linked to a Facebook Page."""
-    async with get_graph_client() as client:
-        resp = await client.get(
-            f"{GRAPH_API_BASE}/{fb_page_id}",
-            params={
-                "fields": "instagram_business_account",
-                "access_token": access_token,
-            },
-        )
-        if resp.status_code != 200:
-            logger.error(f"Failed to get IG business account: {resp.text}")
-            return None
-        data = resp.json()
-        ig_account = data.get("instagram_business_account")
-        return ig_account["id"] if ig_account else None
+    client = get_graph_client()
+    resp = await client.get(
+        f"{GRAPH_API_BASE}/{fb_page_id}",
+        params={
+            "fields": "instagram_business_account",
+            "access_token": access_token,
+        },
+    )
+    if resp.status_code != 200:
+        logger.error(f"Failed to get IG business account: {resp.text}")
+        return None
+    data = resp.json()
+    ig_account = data.get("instagram_business_account")
+    return ig_account["id"] if ig_account else None
 
 
 async def get_instagram_media(access_token: str, ig_user_id: str, limit: int = 10) -> list[dict]:
     """Fetch recent media from an Instagram Business/Creator account."""
-    async with get_graph_client() as client:
-        resp = await client.get(
-            f"{GRAPH_API_BASE}/{ig_user_id}/media",
-            params={
-                "fields": "id,caption,media_type,permalink,timestamp,shortcode",
-                "limit": limit,
-                "access_token": access_token,
-            },
-        )
-        if resp.status_code != 200:
-            logger.error(f"Failed to fetch IG media: {resp.text}")
-            return []
-        data = resp.json()
-        return data.get("data", [])
+    client = get_graph_client()
+    resp = await client.get(
+        f"{GRAPH_API_BASE}/{ig_user_id}/media",
+        params={
+            "fields": "id,caption,media_type,permalink,timestamp,shortcode",
+            "limit": limit,
+            "access_token": access_token,
+        },
+    )
+    if resp.status_code != 200:
+        logger.error(f"Failed to fetch IG media: {resp.text}")
+        return []
+    data = resp.json()
+    return data.get("data", [])
 
 
 async def comment_on_instagram_media(access_token: str, media_id: str, message: str) -> dict | None:
     """Comment on an Instagram media item via the Graph API."""
-    async with get_graph_client() as client:
-        resp = await client.post(
-            f"{GRAPH_API_BASE}/{media_id}/comments",
-            data={"message": message, "access_token": access_token},
-        )
-        if resp.status_code != 200:
-            logger.error(f"Failed to comment on IG media {media_id}: {resp.text}")
-            return None
-        return resp.json()
+    client = get_graph_client()
+    resp = await client.post(
+        f"{GRAPH_API_BASE}/{media_id}/comments",
+        data={"message": message, "access_token": access_token},
+    )
+    if resp.status_code != 200:
+        logger.error(f"Failed to comment on IG media {media_id}: {resp.text}")
+        return None
+    return resp.json()
 
 
 async def like_instagram_media(access_token: str, media_id: str) -> bool:
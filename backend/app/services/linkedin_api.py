@@ -13,9 +13,7 @@ import logging
 import re
 import urllib.parse
 
-import httpx
-
-from app.config import HTTP_TIMEOUT
+from app.core.http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -40,8 +38,7 @@ async def resolve_company_urn(access_token: str, vanity_name: str) -> str | None
     url = f"{LINKEDIN_API_BASE}/organizations"
     params = {"q": "vanityName", "vanityName": vanity_name}
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            resp = await client.get(url, params=params, headers=headers)
+        resp = await get_http_client().get(url, params=params, headers=headers)
         if resp.status_code == 200:
             data = resp.json()
             elements = data.get("elements", [])
@@ -121,8 +118,7 @@ async def _fetch_ugc_posts(headers: dict, author_urn: str, limit: int) -> list[d
         "sortBy": "LAST_MODIFIED",
     }
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            resp = await client.get(url, params=params, headers=headers)
+        resp = await get_http_client().get(url, params=params, headers=headers)
 
         if resp.status_code == 200:
             data = resp.json()
@@ -152,8 +148,7 @@ async def _fetch_shares(headers: dict, author_urn: str, limit: int) -> list[dict
         "sortBy": "LAST_MODIFIED",
     }
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            resp = await client.get(url, params=params, headers=headers)
+        resp = await get_http_client().get(url, params=params, headers=headers)
 
         if resp.status_code == 200:
             data = resp.json()
@@ -273,8 +268,7 @@ async def react_to_post(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            resp = await client.post(url, json=body, headers=headers)
+        resp = await get_http_client().post(url, json=body, headers=headers)
 
         if resp.status_code in (200, 201):
             logger.info(f"Reacted to {activity_urn} as {person_urn}")
@@ -317,8 +311,7 @@ async def comment_on_post(
     }
 
     try:
-        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT) as client:
-            resp = await client.post(url, json=body, headers=headers)
+        resp = await get_http_client().post(url, json=body, headers=headers)
 
         if resp.status_code in (200, 201):
             logger.info(f"Commented on {activity_urn} as {person_urn}")
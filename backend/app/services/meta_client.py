@@ -1,12 +1,12 @@
-"""Shared Meta (Facebook/Instagram) Graph API constants and client factory."""
+"""Shared Meta (Facebook/Instagram) Graph API constants and client accessor."""
 
 import httpx
 
-from app.config import HTTP_TIMEOUT
+from app.core.http_client import get_http_client
 
 GRAPH_API_BASE = "https://graph.facebook.com/v21.0"
 
 
 def get_graph_client() -> httpx.AsyncClient:
-    """Create an httpx client configured for Meta Graph API requests."""
-    return httpx.AsyncClient(timeout=HTTP_TIMEOUT)
+    """Return the shared httpx client for Meta Graph API requests; do not close it."""
+    return get_http_client()
@@ -0,0 +1,144 @@
+"""Coalesce webhook Post inserts into one multi-row INSERT per batch window.
+
+Under a burst of shared links each webhook would otherwise pay its own INSERT
+round trip. Callers queue their row and await its outcome; a single worker
+task drains the queue every BATCH_WINDOW_SECONDS (or BATCH_MAX_ROWS rows) and
+writes the batch in its own committed session. Enabled by WEBHOOK_POST_BATCHING.
+"""
+
+import asyncio
+import logging
+import uuid
+from dataclasses import dataclass
+
+from app.core.ids import uuid7
+from app.database import async_session_factory, dialect_insert
+from app.models.integration import Platform
+from app.models.post import Post
+
+logger = logging.getLogger(__name__)
+
+BATCH_WINDOW_SECONDS = 0.02
+BATCH_MAX_ROWS = 100
+
+
+@dataclass(slots=True)
+class _PendingPost:
+    values: dict
+    future: asyncio.Future
+
+
+_queue: asyncio.Queue | None = None
+_worker: asyncio.Task | None = None
+
+
+def _get_queue() -> asyncio.Queue:
+    """Return the queue for the running loop, starting its worker if needed."""
+    global _queue, _worker
+    if _worker is None or _worker.done() or _worker.get_loop() is not asyncio.get_running_loop():
+        _queue = asyncio.Queue()
+        _worker = asyncio.create_task(_run(_queue))
+    return _queue
+
+
+async def insert_post(
+    tracked_page_id: uuid.UUID, platform: Platform, external_post_id: str, url: str
+) -> uuid.UUID | None:
+    """Insert a post via the next batch; returns its id, or None if it already exists."""
+    future = asyncio.get_running_loop().create_future()
+    values = {
+        "id": uuid7(),
+        "tracked_page_id": tracked_page_id,
+        "platform": platform,
+        "external_post_id": external_post_id,
+        "url": url,
+    }
+    _get_queue().put_nowait(_PendingPost(values, future))
+    return await future
+
+
+async def stop_post_batcher() -> None:
+    """Flush whatever is queued and stop the worker; called on app shutdown."""
+    global _queue, _worker
+    queue, worker = _queue, _worker
+    _queue = _worker = None
+    if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+        return
+    queue.put_nowait(None)
+    await worker
+
+
+async def _run(queue: asyncio.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    stopping = False
+    while not stopping:
+        # None is the stop signal from stop_post_batcher(), queued after every real row
+        item = await queue.get()
+        if item is None:
+            return
+        batch = [item]
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(batch) < BATCH_MAX_ROWS:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        await _flush(batch)
+
+
+async def _insert(rows: list[dict]) -> dict[str, uuid.UUID]:
+    """Insert rows in one statement; returns external_post_id -> id for rows not already present."""
+    async with async_session_factory() as session:
+        stmt = (
+            dialect_insert(session, Post)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=[Post.external_post_id])
+            .returning(Post.external_post_id, Post.id)
+        )
+        inserted = dict((await session.execute(stmt)).all())
+        await session.commit()
+    return inserted
+
+
+async def _flush(batch: list[_PendingPost]) -> None:
+    # The first row queued for an external_post_id wins; later ones are duplicates
+    rows: dict[str, dict] = {}
+    for item in batch:
+        rows.setdefault(item.values["external_post_id"], item.values)
+
+    outcomes: dict[str, uuid.UUID | Exception] = {}
+    try:
+        outcomes.update(await _insert(list(rows.values())))
+    except Exception as e:
+        if len(rows) == 1:
+            logger.error(f"Insert of post {next(iter(rows))} failed: {e}")
+            outcomes.update(dict.fromkeys(rows, e))
+        else:
+            # One bad row fails the whole statement: retry each row on its own
+            # so only the request that sent the bad row gets the error
+            logger.warning(f"Batched insert of {len(rows)} posts failed, retrying per row: {e}")
+            for external_post_id, values in rows.items():
+                try:
+                    outcomes.update(await _insert([values]))
+                except Exception as row_error:
+                    logger.error(f"Insert of post {external_post_id} failed: {row_error}")
+                    outcomes[external_post_id] = row_error
+
+    for item in batch:
+        external_post_id = item.values["external_post_id"]
+        outcome = outcomes.get(external_post_id)
+        if isinstance(outcome, Exception):
+            if not item.future.done():
+                item.future.set_exception(outcome)
+            continue
+        # Only the first request for an external_post_id gets the new id
+        outcomes.pop(external_post_id, None)
+        if not item.future.done():
+            item.future.set_result(outcome)
@@ -6,38 +6,71 @@ from urllib.parse import parse_qs, urlparse
 from app.models.integration import Platform
 from app.models.tracked_page import PageType
 
+# Registered domains per site; subdomains (www., m., web.) match by suffix
+LINKEDIN_DOMAINS = frozenset({"linkedin.com"})
+INSTAGRAM_DOMAINS = frozenset({"instagram.com", "instagr.am"})
+FACEBOOK_DOMAINS = frozenset({"facebook.com", "fb.com"})
+_LINKEDIN_SUFFIXES = tuple(f".{d}" for d in LINKEDIN_DOMAINS)
+_INSTAGRAM_SUFFIXES = tuple(f".{d}" for d in INSTAGRAM_DOMAINS)
+_FACEBOOK_SUFFIXES = tuple(f".{d}" for d in FACEBOOK_DOMAINS)
+
+# scheme://[userinfo@]host[:port]path — the hot paths only need host and path
+_URL_HOST_PATH_RE = re.compile(
+    r"^[a-z][a-z0-9+.-]*://(?:[^/?#@]*@)?([^/?#:]*)(?::[^/?#]*)?([^?#]*)", re.IGNORECASE
+)
+
+# Compiled once at import — these helpers run per row in bulk imports and per webhook
+_LI_ACTIVITY_URN_RE = re.compile(r"urn:li:activity:(\d+)")
+_LI_POSTS_RE = re.compile(r"/posts/([^/]+)")
+_LI_FEED_UPDATE_RE = re.compile(r"/feed/update/([^/?]+)")
+_LI_EXTERNAL_ID_RE = re.compile(r"(in|company)/([^/]+)")
+
+_IG_POST_RE = re.compile(r"/(p|reel|tv)/([A-Za-z0-9_-]+)")
+_IG_NON_PROFILE_RE = re.compile(r"^(p|reel|tv|stories|explore|accounts)/")
+
+_FB_REEL_RE = re.compile(r"/reel/(\d+)")
+_FB_POSTS_NUMERIC_RE = re.compile(r"/posts/(\d+)")
+_FB_POSTS_PFBID_RE = re.compile(r"/posts/(pfbid[A-Za-z0-9]+)")
+_FB_NON_PAGE_RE = re.compile(
+    r"^(permalink\.php|photo|watch|reel|stories|events|marketplace|groups)"
+)
+
+
+def split_url(url: str) -> tuple[str, str]:
+    """Return the lowercased host and the path of an absolute URL.
+
+    A cheaper stand-in for ``urlparse(url).hostname`` / ``.path``; returns
+    ``("", "")`` when the URL has no scheme.
+    """
+    match = _URL_HOST_PATH_RE.match(url)
+    if not match:
+        return "", ""
+    return match.group(1).lower(), match.group(2)
+
+
 # ---------------------------------------------------------------------------
 # Platform detection
 # ---------------------------------------------------------------------------
 
 
+def _host_in(url: str, domains: frozenset[str], suffixes: tuple[str, ...]) -> bool:
+    host = split_url(url)[0].rstrip(".")
+    return host in domains or host.endswith(suffixes)
+
+
 def is_linkedin_url(url: str) -> bool:
     """Check if a URL is a LinkedIn URL."""
-    parsed = urlparse(url)
-    return "linkedin.com" in parsed.netloc.lower()
+    return _host_in(url, LINKEDIN_DOMAINS, _LINKEDIN_SUFFIXES)
 
 
 def is_instagram_url(url: str) -> bool:
     """Check if a URL is an Instagram URL."""
-    parsed = urlparse(url)
-    return any(
-        d in parsed.netloc.lower() for d in ["instagram.com", "www.instagram.com", "instagr.am"]
-    )
+    return _host_in(url, INSTAGRAM_DOMAINS, _INSTAGRAM_SUFFIXES)
 
 
 def is_facebook_url(url: str) -> bool:
     """Check if a URL is a Facebook URL."""
-    parsed = urlparse(url)
-    return any(
-        d in parsed.netloc.lower()
-        for d in [
-            "facebook.com",
-            "www.facebook.com",
-            "fb.com",
-            "m.facebook.com",
-            "web.facebook.com",
-        ]
-    )
+    return _host_in(url, FACEBOOK_DOMAINS, _FACEBOOK_SUFFIXES)
 
 
 def detect_platform(url: str) -> Platform:
@@ -116,17 +149,17 @@ def extract_linkedin_post_id(url: str) -> str | None:
     path = parsed.path
 
     # Activity URN pattern
-    urn_match = re.search(r"urn:li:activity:(\d+)", url)
+    urn_match = _LI_ACTIVITY_URN_RE.search(url)
     if urn_match:
         return f"urn:li:activity:{urn_match.group(1)}"
 
     # /posts/ pattern
-    posts_match = re.search(r"/posts/([^/]+)", path)
+    posts_match = _LI_POSTS_RE.search(path)
     if posts_match:
         return f"posts/{posts_match.group(1)}"
 
     # /feed/update/ pattern
-    update_match = re.search(r"/feed/update/([^/?]+)", path)
+    update_match = _LI_FEED_UPDATE_RE.search(path)
     if update_match:
         return update_match.group(1)
 
@@ -144,7 +177,7 @@ def extract_instagram_post_id(url: str) -> str | None:
     parsed = urlparse(url)
     path = parsed.path
 
-    match = re.search(r"/(p|reel|tv)/([A-Za-z0-9_-]+)", path)
+    match = _IG_POST_RE.search(path)
     if match:
         return match.group(2)
     return None
@@ -185,17 +218,17 @@ def extract_facebook_post_id(url: str) -> str | None:
             return f"video_{video_id}"
 
     # /reel/123
-    reel_match = re.search(r"/reel/(\d+)", path)
+    reel_match = _FB_REEL_RE.search(path)
     if reel_match:
         return f"reel_{reel_match.group(1)}"
 
     # /username/posts/123 or /groups/gid/posts/123
-    posts_match = re.search(r"/posts/(\d+)", path)
+    posts_match = _FB_POSTS_NUMERIC_RE.search(path)
     if posts_match:
         return f"post_{posts_match.group(1)}"
 
     # /username/posts/pfbid... (new-style alphanumeric IDs)
-    pfbid_match = re.search(r"/posts/(pfbid[A-Za-z0-9]+)", path)
+    pfbid_match = _FB_POSTS_PFBID_RE.search(path)
     if pfbid_match:
         return f"post_{pfbid_match.group(1)}"
 
@@ -236,7 +269,7 @@ def get_instagram_profile_username(url: str) -> str | None:
     parsed = urlparse(url)
     path = parsed.path.strip("/")
     # Skip post/reel/tv paths
-    if re.match(r"^(p|reel|tv|stories|explore|accounts)/", path):
+    if _IG_NON_PROFILE_RE.match(path):
         return None
     # The first path segment is the username
     parts = path.split("/")
@@ -250,7 +283,7 @@ def get_facebook_page_username(url: str) -> str | None:
     parsed = urlparse(url)
     path = parsed.path.strip("/")
     # Skip non-page paths
-    if re.match(r"^(permalink\.php|photo|watch|reel|stories|events|marketplace|groups)", path):
+    if _FB_NON_PAGE_RE.match(path):
         return None
     parts = path.split("/")
     if parts and parts[0]:
@@ -263,7 +296,7 @@ def extract_external_id(url: str, platform: Platform) -> str | None:
     parsed = urlparse(url)
     path = parsed.path.strip("/")
     if platform == Platform.LINKEDIN:
-        match = re.match(r"(in|company)/([^/]+)", path)
+        match = _LI_EXTERNAL_ID_RE.match(path)
         if match:
             return f"{match.group(1)}/{match.group(2)}"
     if platform == Platform.META:
@@ -1,10 +1,10 @@
 """Engagement task workers — like and comment on social-media posts.
 
 Architecture notes:
-- Each Celery task uses asyncio.run() which creates a *new* event loop, so the
+- Each Celery task uses run_task() which creates a *new* event loop, so the
   web server's SQLAlchemy session factory cannot be reused.  All DB access
-  inside async helpers must go through get_task_session() which builds a fresh
-  engine per invocation.
+  inside async helpers must go through get_task_session(), whose sessions share
+  one engine per run_task() call.
 - Imports of app models / services are deferred inside the async helpers to
   avoid circular imports and to keep Celery's module-loading lightweight.
 - Retry strategy: network-level errors (timeout, connect) and Celery
@@ -16,14 +16,15 @@ Architecture notes:
   (COMMENT_INTER_USER_DELAY * user_index) to avoid a burst of AI comments.
 """
 
-import asyncio
 import logging
 import random
+import uuid
 from datetime import UTC, datetime
 
 import httpx
 from celery.exceptions import SoftTimeLimitExceeded
 
+from app.database import run_task
 from app.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -36,13 +37,13 @@ logger = logging.getLogger(__name__)
 )
 def schedule_staggered_engagements(post_id: str, tracked_page_id: str):
     """Create engagement actions for all subscribed users and stagger their execution."""
-    asyncio.run(_schedule_engagements(post_id, tracked_page_id))
+    run_task(_schedule_engagements(post_id, tracked_page_id))
 
 
 async def _schedule_engagements(post_id: str, tracked_page_id: str):
     import uuid
 
-    from sqlalchemy import func, select
+    from sqlalchemy import exists, func, select
 
     from app.database import get_task_session
     from app.models.engagement import ActionStatus, ActionType, EngagementAction
@@ -64,12 +65,14 @@ async def _schedule_engagements(post_id: str, tracked_page_id: str):
         for i, sub in enumerate(subscriptions):
             # Skip if user already has any engagement action for this post
             existing = await db.execute(
-                select(EngagementAction).where(
-                    EngagementAction.post_id == uuid.UUID(post_id),
-                    EngagementAction.user_id == sub.user_id,
+                select(
+                    exists().where(
+                        EngagementAction.post_id == uuid.UUID(post_id),
+                        EngagementAction.user_id == sub.user_id,
+                    )
                 )
             )
-            if existing.scalar_one_or_none():
+            if existing.scalar():
                 logger.debug(
                     f"Skipping - engagement already exists for user {sub.user_id} on post {post_id}"
                 )
@@ -222,8 +225,8 @@ def execute_engagement(self, engagement_action_id: str):
     from app.core.locks import acquire_user_lock
 
     # Pre-lock lookup: get user_id and platform so we can acquire a per-user lock.
-    # This must use asyncio.run() because get_task_session() is async.
-    lookup = asyncio.run(_lookup_engagement_meta(engagement_action_id))
+    # This must use run_task() because get_task_session() is async.
+    lookup = run_task(_lookup_engagement_meta(engagement_action_id))
     if lookup is None:
         logger.error(f"Engagement action {engagement_action_id} not found or missing post")
         return
@@ -240,7 +243,7 @@ def execute_engagement(self, engagement_action_id: str):
         raise self.retry(countdown=30)  # Retry after 30 seconds
 
     try:
-        asyncio.run(_execute_engagement(engagement_action_id))
+        run_task(_execute_engagement(engagement_action_id))
     except (httpx.TimeoutException, httpx.ConnectError, SoftTimeLimitExceeded) as e:
         logger.warning(f"Retriable error for {engagement_action_id}: {e}")
         raise self.retry(exc=e) from e
@@ -330,6 +333,12 @@ async def _execute_engagement(engagement_action_id: str):
         from app.models.integration import Platform as IntPlatform
 
         platform_value = post.platform.value
+        if platform_value == "meta":
+            # Meta actions always run in the browser; launch it while tokens and
+            # the comment are prepared
+            from app.automation.browser_manager import start_browser
+
+            start_browser()
 
         integration = None
         access_token = None
@@ -375,7 +384,7 @@ async def _execute_engagement(engagement_action_id: str):
             if action.action_type == ActionType.LIKE:
                 success = await _execute_like(
                     platform_value,
-                    str(action.user_id),
+                    action.user_id,
                     post,
                     integration=integration,
                     access_token=access_token,
@@ -420,7 +429,7 @@ async def _execute_engagement(engagement_action_id: str):
 
                 success = await _execute_comment(
                     platform_value,
-                    str(action.user_id),
+                    action.user_id,
                     post,
                     comment_result["comment"],
                     integration=integration,
@@ -478,7 +487,7 @@ def _get_comment_platform(platform_value: str, post_url: str) -> str:
 
 
 async def _execute_like(
-    platform_value: str, user_id: str, post, integration=None, access_token=None
+    platform_value: str, user_id: uuid.UUID, post, integration=None, access_token=None
 ) -> bool:
     """Execute a like action on the appropriate platform.
 
@@ -518,7 +527,7 @@ async def _execute_like(
         # Fallback: Playwright (requires browser session cookies)
         from app.automation.linkedin_actions import like_post
 
-        result = await like_post(user_id, post.url)
+        result = await like_post(str(user_id), post.url)
         return result
 
     elif platform_value == "meta":
@@ -527,7 +536,7 @@ async def _execute_like(
         if is_instagram_url(post.url):
             from app.automation.instagram_actions import like_post as ig_like
 
-            result = await ig_like(user_id, post.url)
+            result = await ig_like(str(user_id), post.url)
             return result
         else:
             from app.automation.facebook_actions import like_post as fb_like
@@ -539,7 +548,12 @@ async def _execute_like(
 
 
 async def _execute_comment(
-    platform_value: str, user_id: str, post, comment_text: str, integration=None, access_token=None
+    platform_value: str,
+    user_id: uuid.UUID,
+    post,
+    comment_text: str,
+    integration=None,
+    access_token=None,
 ) -> bool:
     """Execute a comment action on the appropriate platform.
 
@@ -578,7 +592,7 @@ async def _execute_comment(
         # Fallback: Playwright
         from app.automation.linkedin_actions import comment_on_post
 
-        result = await comment_on_post(user_id, post.url, comment_text)
+        result = await comment_on_post(str(user_id), post.url, comment_text)
         return result
 
     elif platform_value == "meta":
@@ -587,7 +601,7 @@ async def _execute_comment(
         if is_instagram_url(post.url):
             from app.automation.instagram_actions import comment_on_post as ig_comment
 
-            result = await ig_comment(user_id, post.url, comment_text)
+            result = await ig_comment(str(user_id), post.url, comment_text)
             return result
         else:
             from app.automation.facebook_actions import comment_on_post as fb_comment
@@ -1,7 +1,7 @@
 """Polling task worker — discover new posts on tracked social-media pages.
 
 Architecture notes:
-- Uses asyncio.run() per invocation → requires get_task_session() for DB
+- Uses run_task() per invocation → requires get_task_session() for DB
   access (see engagement_tasks.py docstring for full rationale).
 - Beat schedule fires dispatch_poll_tasks which fans out individual
   poll_single_page_task calls — one per tracked page — so Celery workers
@@ -12,9 +12,9 @@ Architecture notes:
   using the stored access_token from IntegrationAccount.
 """
 
-import asyncio
 import logging
 
+from app.database import run_task
 from app.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -30,7 +30,7 @@ POLL_PAGE_LOCK_TTL = 110  # seconds — less than soft_time_limit of 120
 )
 def dispatch_poll_tasks():
     """Beat task: fan out individual poll tasks for each active tracked page."""
-    asyncio.run(_dispatch_polls())
+    run_task(_dispatch_polls())
 
 
 async def _dispatch_polls():
@@ -120,7 +120,7 @@ def poll_single_page_task(tracked_page_id: str):
         return
 
     try:
-        asyncio.run(_poll_page_by_id(tracked_page_id))
+        run_task(_poll_page_by_id(tracked_page_id))
     finally:
         import contextlib
 
@@ -137,8 +137,8 @@ async def _poll_page_by_id(tracked_page_id: str):
     from sqlalchemy import select
 
     from app.config import settings
-    from app.database import get_task_session
-    from app.models.tracked_page import TrackedPage
+    from app.database import dialect_insert, get_task_session
+    from app.models.tracked_page import TrackedPage, TrackedPagePollState
 
     status_key = f"autoengage:poll_status:{tracked_page_id}"
     r = sync_redis.from_url(settings.redis_url)
@@ -180,8 +180,20 @@ async def _poll_page_by_id(tracked_page_id: str):
         r.set(status_key, json.dumps(status_payload), ex=86400)  # 24hr TTL
 
         # Write to DB (persistent — survives Redis flush/TTL)
-        page.last_polled_at = datetime.now(UTC)
-        page.last_poll_status = poll_result.get("status", "ok")[:50]
+        poll_state = dialect_insert(db, TrackedPagePollState).values(
+            tracked_page_id=page.id,
+            last_polled_at=datetime.now(UTC),
+            last_poll_status=poll_result.get("status", "ok")[:50],
+        )
+        await db.execute(
+            poll_state.on_conflict_do_update(
+                index_elements=["tracked_page_id"],
+                set_={
+                    "last_polled_at": poll_state.excluded.last_polled_at,
+                    "last_poll_status": poll_state.excluded.last_poll_status,
+                },
+            )
+        )
 
         await db.commit()
 
@@ -194,8 +206,6 @@ async def _poll_single_page(db, page) -> dict:
 
     Returns a status dict: {status, posts_found, new_posts, error}.
     """
-    from sqlalchemy import select
-
     from app.models.integration import Platform
     from app.models.post import Post
     from app.models.tracked_page import PageType
@@ -221,38 +231,34 @@ async def _poll_single_page(db, page) -> dict:
             "error": "Unsupported platform",
         }
 
-    from sqlalchemy.exc import IntegrityError
+    from app.database import dialect_insert
 
     new_count = 0
     for post_data in posts_data:
+        # Insert unless the post is already known (seen earlier, via webhook, or concurrently)
         result = await db.execute(
-            select(Post).where(Post.external_post_id == post_data["external_id"])
+            dialect_insert(db, Post)
+            .values(
+                tracked_page_id=page.id,
+                platform=page.platform,
+                external_post_id=post_data["external_id"],
+                url=post_data["url"],
+                content_text=post_data.get("content"),
+            )
+            .on_conflict_do_nothing(index_elements=[Post.external_post_id])
+            .returning(Post.id)
         )
-        if result.scalar_one_or_none():
-            continue
-
-        post = Post(
-            tracked_page_id=page.id,
-            platform=page.platform,
-            external_post_id=post_data["external_id"],
-            url=post_data["url"],
-            content_text=post_data.get("content"),
-        )
-        db.add(post)
-        try:
-            await db.flush()
-        except IntegrityError:
-            await db.rollback()
-            logger.debug(f"Post {post_data['external_id']} already exists (concurrent insert)")
+        post_id = result.scalar_one_or_none()
+        if post_id is None:
             continue
 
         new_count += 1
-        logger.info(f"New post detected: {post.url}")
+        logger.info(f"New post detected: {post_data['url']}")
 
         # Schedule engagement task - it will check for existing engagements internally
         from app.workers.engagement_tasks import schedule_staggered_engagements
 
-        schedule_staggered_engagements.delay(str(post.id), str(page.id))
+        schedule_staggered_engagements.delay(str(post_id), str(page.id))
 
     return {"status": "ok", "posts_found": len(posts_data), "new_posts": new_count, "error": None}
 
@@ -335,11 +341,9 @@ async def _get_linkedin_cookies(db, org_id) -> list[dict] | None:
     Handles both encrypted (string) and plain (list/dict) cookie formats.
     Returns cookies in Playwright format: list of {name, value, domain, path}.
     """
-    import json
-
     from sqlalchemy import select
 
-    from app.core.security import decrypt_value
+    from app.core.security import decrypt_json
     from app.models.integration import IntegrationAccount, Platform
     from app.models.user import User
 
@@ -363,8 +367,7 @@ async def _get_linkedin_cookies(db, org_id) -> list[dict] | None:
     # Handle encrypted cookies (stored as string after encryption changes)
     if isinstance(cookies_data, str):
         try:
-            decrypted = decrypt_value(cookies_data)
-            cookies_data = json.loads(decrypted)
+            cookies_data = decrypt_json(cookies_data)
         except Exception:
             logger.warning(f"Failed to decrypt cookies for org {org_id}")
             return None
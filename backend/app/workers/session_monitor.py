@@ -2,20 +2,19 @@
 
 Architecture notes:
 - Runs on a schedule (via Celery beat) to check all LinkedIn integrations
-- Uses the existing check_session_valid function from linkedin_actions
+- Uses check_sessions_valid from linkedin_actions to check due sessions concurrently
 - Updates is_active flag if session is invalid
 - Updates last_session_check timestamp after each check
 - Logs warnings for invalid sessions (could be extended to send email alerts)
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
 from sqlalchemy import select, update
 
-from app.automation.linkedin_actions import check_session_valid
-from app.database import get_task_session
+from app.automation.linkedin_actions import check_sessions_valid
+from app.database import get_task_session, run_task
 from app.models.integration import IntegrationAccount, Platform
 from app.workers.celery_app import celery_app
 
@@ -32,7 +31,7 @@ MIN_CHECK_INTERVAL = timedelta(hours=1)
 )
 def check_linkedin_sessions():
     """Beat task: check all LinkedIn session cookies are still valid."""
-    asyncio.run(_check_sessions())
+    run_task(_check_sessions())
 
 
 async def _check_sessions():
@@ -53,6 +52,7 @@ async def _check_sessions():
         skipped_count = 0
         now = datetime.now(UTC)
 
+        due = []
         for integration in integrations:
             user_id = str(integration.user_id)
 
@@ -63,31 +63,32 @@ async def _check_sessions():
                     skipped_count += 1
                     logger.debug(f"Skipping {user_id} - checked recently")
                     continue
+            due.append(integration)
 
-            try:
-                is_valid = await check_session_valid(user_id)
-
-                # Update last_session_check timestamp
-                integration.last_session_check = now
-
-                if is_valid:
-                    valid_count += 1
-                    logger.debug(f"Session valid for user {user_id}")
-                else:
-                    invalid_count += 1
-                    # Mark integration as inactive
-                    integration.is_active = False
-                    logger.warning(f"Session expired for user {user_id}, marked inactive")
-
-                    # Could extend this to:
-                    # - Send email notification to user
-                    # - Update a status field to show "expired" in UI
-                    # - Trigger a webhook to notify the app
-
-            except Exception as e:
-                # Still update last_session_check even on error
-                integration.last_session_check = now
-                logger.error(f"Error checking session for user {user_id}: {e}")
+        results = await check_sessions_valid([str(integration.user_id) for integration in due])
+
+        for integration in due:
+            user_id = str(integration.user_id)
+            is_valid = results[user_id]
+
+            # Update last_session_check timestamp, even on error
+            integration.last_session_check = now
+
+            if isinstance(is_valid, Exception):
+                logger.error(f"Error checking session for user {user_id}: {is_valid}")
+            elif is_valid:
+                valid_count += 1
+                logger.debug(f"Session valid for user {user_id}")
+            else:
+                invalid_count += 1
+                # Mark integration as inactive
+                integration.is_active = False
+                logger.warning(f"Session expired for user {user_id}, marked inactive")
+
+                # Could extend this to:
+                # - Send email notification to user
+                # - Update a status field to show "expired" in UI
+                # - Trigger a webhook to notify the app
 
         await db.commit()
         logger.info(
@@ -11,10 +11,10 @@ Also retries FAILED actions with exponential backoff:
 Permanent failures (button not found, already liked) are NOT retried.
 """
 
-import asyncio
 import logging
 from datetime import UTC, datetime, timedelta
 
+from app.database import run_task
 from app.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
@@ -59,7 +59,7 @@ def is_permanent_failure(error_message: str | None) -> bool:
 )
 def cleanup_stale_actions():
     """Beat task: find and recover stale engagement actions."""
-    asyncio.run(_cleanup())
+    run_task(_cleanup())
 
 
 async def _cleanup():
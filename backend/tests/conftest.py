@@ -30,6 +30,13 @@ TestSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_com
 
 # Map PostgreSQL-specific types to SQLite equivalents for testing
 if _is_sqlite:
+    # SQLite ignores ON DELETE rules unless foreign keys are switched on per connection
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
     @event.listens_for(Base.metadata, "column_reflect")
     def _column_reflect(inspector, table, column_info):
         if isinstance(column_info["type"], JSONB):
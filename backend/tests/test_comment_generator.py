@@ -7,6 +7,7 @@ import pytest
 
 from app.services.comment_generator import (
     PLATFORM_TONE,
+    _with_cached_system_prompt,
     generate_and_review_comment,
     generate_comments,
     review_comment,
@@ -34,6 +35,23 @@ class TestPlatformTone:
         assert "friendly" in PLATFORM_TONE["facebook"].lower()
 
 
+class TestPromptCaching:
+    def test_marks_system_prompt_for_anthropic_models(self):
+        messages = [
+            {"role": "system", "content": "rules"},
+            {"role": "user", "content": "post"},
+        ]
+        result = _with_cached_system_prompt("anthropic/claude-sonnet-4-5-20250929", messages)
+        assert result[0]["content"] == [
+            {"type": "text", "text": "rules", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert result[1] == {"role": "user", "content": "post"}
+
+    def test_leaves_other_models_unchanged(self):
+        messages = [{"role": "system", "content": "rules"}]
+        assert _with_cached_system_prompt("openai/gpt-4o", messages) == messages
+
+
 class TestGenerateComments:
     @pytest.mark.asyncio
     @patch("app.services.comment_generator._call_openrouter")
@@ -0,0 +1,180 @@
+"""Tests for tracked page deletion, poll state and subscriptions."""
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.dependencies import get_current_user
+from app.main import app
+from app.models.engagement import ActionType, EngagementAction
+from app.models.integration import Platform
+from app.models.invite import OrgInvite
+from app.models.org import Org
+from app.models.post import Post
+from app.models.team import Team
+from app.models.tracked_page import TrackedPage, TrackedPagePollState, TrackedPageSubscription
+from app.models.user import User, UserRole
+from app.workers import polling_tasks
+
+
+async def _create_user_and_page(db: AsyncSession) -> tuple[User, TrackedPage]:
+    """Helper: create an org with an owner, logged in for API calls, and a tracked page."""
+    org = Org(name="Test Org")
+    db.add(org)
+    await db.flush()
+
+    user = User(
+        org_id=org.id,
+        email=f"owner-{uuid.uuid4().hex[:8]}@example.com",
+        full_name="Owner",
+        role=UserRole.OWNER,
+    )
+    page = TrackedPage(
+        org_id=org.id,
+        platform=Platform.LINKEDIN,
+        external_id="johndoe",
+        url="https://www.linkedin.com/in/johndoe",
+        name="John Doe",
+        page_type="personal",
+        active=True,
+    )
+    db.add_all([user, page])
+    await db.commit()
+
+    app.dependency_overrides[get_current_user] = lambda: user
+    return user, page
+
+
+async def _count(db: AsyncSession, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+@pytest.mark.asyncio
+async def test_delete_tracked_page_cascades(client: AsyncClient, db: AsyncSession):
+    user, page = await _create_user_and_page(db)
+    post = Post(
+        tracked_page_id=page.id,
+        platform=Platform.LINKEDIN,
+        external_post_id="urn:li:activity:1",
+        url="https://www.linkedin.com/feed/update/urn:li:activity:1",
+    )
+    db.add_all(
+        [
+            post,
+            TrackedPageSubscription(tracked_page_id=page.id, user_id=user.id),
+            TrackedPagePollState(
+                tracked_page_id=page.id, last_polled_at=datetime.now(UTC), last_poll_status="ok"
+            ),
+        ]
+    )
+    await db.flush()
+    db.add(EngagementAction(post_id=post.id, user_id=user.id, action_type=ActionType.LIKE))
+    await db.commit()
+
+    response = await client.delete(f"/api/tracked-pages/{page.id}")
+    assert response.status_code == 204
+
+    # The database removes the page's dependents; the user is untouched
+    for model in (
+        TrackedPage,
+        Post,
+        EngagementAction,
+        TrackedPageSubscription,
+        TrackedPagePollState,
+    ):
+        assert await _count(db, model) == 0
+    assert await _count(db, User) == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_team_unassigns_members_and_invites(client: AsyncClient, db: AsyncSession):
+    user, _ = await _create_user_and_page(db)
+    team = Team(org_id=user.org_id, name="Sales")
+    db.add(team)
+    await db.flush()
+    user.team_id = team.id
+    invite = OrgInvite(
+        org_id=user.org_id,
+        invited_by=user.id,
+        invite_code=uuid.uuid4().hex,
+        expires_at=datetime.now(UTC) + timedelta(days=7),
+        team_id=team.id,
+    )
+    db.add(invite)
+    await db.commit()
+
+    response = await client.delete(f"/api/org/teams/{team.id}")
+    assert response.status_code == 204
+
+    await db.refresh(user)
+    await db.refresh(invite)
+    assert user.team_id is None
+    assert invite.team_id is None
+    assert await _count(db, Team) == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_state_upserts_and_shows_in_page_list(client: AsyncClient, db: AsyncSession):
+    _, page = await _create_user_and_page(db)
+
+    session_factory = async_sessionmaker(db.bind, expire_on_commit=False)
+
+    @asynccontextmanager
+    async def task_session():
+        async with session_factory() as session:
+            yield session
+
+    with (
+        patch("app.database.get_task_session", task_session),
+        patch("redis.from_url", return_value=MagicMock()),
+        patch.object(polling_tasks, "_poll_single_page") as poll_single_page,
+    ):
+        poll_single_page.return_value = {"status": "ok", "posts_found": 1, "new_posts": 1}
+        await polling_tasks._poll_page_by_id(str(page.id))
+        poll_single_page.side_effect = RuntimeError("feed unavailable")
+        await polling_tasks._poll_page_by_id(str(page.id))
+
+    # Each poll rewrites the page's single poll state row
+    result = await db.execute(select(TrackedPagePollState))
+    poll_state = result.scalar_one()
+    assert poll_state.tracked_page_id == page.id
+    assert poll_state.last_poll_status == "error"
+
+    response = await client.get("/api/tracked-pages")
+    assert response.status_code == 200
+    [listed] = response.json()
+    assert listed["last_poll_status"] == "error"
+    assert listed["last_polled_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_never_polled_page_lists_without_poll_state(client: AsyncClient, db: AsyncSession):
+    await _create_user_and_page(db)
+
+    response = await client.get("/api/tracked-pages")
+    assert response.status_code == 200
+    [listed] = response.json()
+    assert listed["last_polled_at"] is None
+    assert listed["last_poll_status"] is None
+
+
+@pytest.mark.asyncio
+async def test_subscribe_twice_conflicts(client: AsyncClient, db: AsyncSession):
+    _, page = await _create_user_and_page(db)
+
+    response = await client.post(f"/api/tracked-pages/{page.id}/subscribe", json={})
+    assert response.status_code == 201
+    assert response.json()["tracked_page_id"] == str(page.id)
+
+    response = await client.post(f"/api/tracked-pages/{page.id}/subscribe", json={})
+    assert response.status_code == 409
+    assert await _count(db, TrackedPageSubscription) == 1
+
+    response = await client.post(f"/api/tracked-pages/{uuid.uuid4()}/subscribe", json={})
+    assert response.status_code == 404
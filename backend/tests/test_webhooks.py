@@ -1,17 +1,19 @@
 """Tests for WhatsApp webhook endpoint."""
 
+import asyncio
 import uuid
 from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.integration import Platform
 from app.models.org import Org
 from app.models.post import Post
 from app.models.tracked_page import TrackedPage
+from app.services import post_batcher
 
 
 async def _create_tracked_page(db: AsyncSession) -> TrackedPage:
@@ -64,6 +66,28 @@ async def test_webhook_creates_post_and_enqueues(mock_task, client: AsyncClient,
     mock_task.delay.assert_called_once_with(str(post.id), str(page.id))
 
 
+@pytest.mark.asyncio
+@patch("app.api.webhooks.schedule_staggered_engagements")
+async def test_webhook_commits_before_enqueueing(mock_task, client: AsyncClient, db: AsyncSession):
+    await _create_tracked_page(db)
+    # Record whether the post insert was still uncommitted when the task was sent
+    pending_at_enqueue = []
+    mock_task.delay.side_effect = lambda *args: pending_at_enqueue.append(db.in_transaction())
+
+    response = await client.post(
+        "/api/webhooks/whatsapp-link",
+        json={
+            "url": "https://www.linkedin.com/posts/johndoe_commit-post-7123456789-abcd",
+            "group_name": "Group",
+            "sender": "Bob",
+            "timestamp": "2025-01-01T12:00:00Z",
+        },
+    )
+
+    assert response.json()["status"] == "matched"
+    assert pending_at_enqueue == [False]
+
+
 @pytest.mark.asyncio
 @patch("app.api.webhooks.schedule_staggered_engagements")
 async def test_webhook_deduplicates(mock_task, client: AsyncClient, db: AsyncSession):
@@ -103,6 +127,21 @@ async def test_webhook_ignores_non_social_url(client: AsyncClient):
     assert response.json()["status"] == "ignored"
 
 
+@pytest.mark.asyncio
+async def test_webhook_ignores_lookalike_domain(client: AsyncClient):
+    response = await client.post(
+        "/api/webhooks/whatsapp-link",
+        json={
+            "url": "https://www.evilfacebook.com/someone/posts/123",
+            "group_name": "Group",
+            "sender": "Eve",
+            "timestamp": "2025-01-01T12:00:00Z",
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "ignored"
+
+
 @pytest.mark.asyncio
 async def test_webhook_unmatched_url(client: AsyncClient, db: AsyncSession):
     # No tracked pages — URL should be unmatched
@@ -117,3 +156,50 @@ async def test_webhook_unmatched_url(client: AsyncClient, db: AsyncSession):
     )
     assert response.status_code == 200
     assert response.json()["status"] == "unmatched"
+
+
+@pytest.mark.asyncio
+async def test_post_batcher_coalesces_concurrent_inserts(db: AsyncSession):
+    page = await _create_tracked_page(db)
+    external_ids = ["posts/a", "posts/b", "posts/a"]
+
+    session_factory = async_sessionmaker(db.bind, expire_on_commit=False)
+    with patch.object(post_batcher, "async_session_factory", session_factory):
+        ids = await asyncio.gather(
+            *(
+                post_batcher.insert_post(page.id, Platform.LINKEDIN, ext, f"https://x/{ext}")
+                for ext in external_ids
+            )
+        )
+        again = await post_batcher.insert_post(page.id, Platform.LINKEDIN, "posts/b", "https://x")
+
+    # First claim per external_post_id wins, in or across batches
+    assert ids[0] is not None and ids[1] is not None
+    assert ids[2] is None
+    assert again is None
+
+    result = await db.execute(select(Post.external_post_id))
+    assert sorted(result.scalars().all()) == ["posts/a", "posts/b"]
+
+
+@pytest.mark.asyncio
+async def test_post_batcher_isolates_failing_row(db: AsyncSession):
+    page = await _create_tracked_page(db)
+
+    session_factory = async_sessionmaker(db.bind, expire_on_commit=False)
+    with patch.object(post_batcher, "async_session_factory", session_factory):
+        good, bad = await asyncio.gather(
+            post_batcher.insert_post(page.id, Platform.LINKEDIN, "posts/good", "https://x/good"),
+            # url is NOT NULL, so this row fails the batch's INSERT
+            post_batcher.insert_post(page.id, Platform.LINKEDIN, "posts/bad", None),
+            return_exceptions=True,
+        )
+        await post_batcher.stop_post_batcher()
+
+    # Only the request that sent the bad row sees the error
+    assert isinstance(good, uuid.UUID)
+    assert isinstance(bad, Exception)
+    assert post_batcher._worker is None
+
+    result = await db.execute(select(Post.external_post_id))
+    assert result.scalars().all() == ["posts/good"]